@@ -0,0 +1 @@
+"""Modul pendukung Dashboard Peminjaman Sepeda."""
@@ -0,0 +1,196 @@
+"""Agregat dari data per jam: cube untuk grafik per jam dan rollup harian.
+
+Cube berisi jumlah casual/registered/cnt per kombinasi
+tanggal x jam x hari libur x cuaca x musim. Cube dibangun sekali saat data
+dimuat; grafik per jam cukup menjumlahkan potongan cube ini, sehingga
+waktunya tidak bergantung pada jumlah baris mentah (misalnya banyak stasiun).
+
+Rollup menghasilkan frame setara day.csv dari hour.csv dalam satu groupby,
+sehingga hanya hour.csv yang perlu dimuat; cara yang sama dipakai untuk
+rollup mingguan dan bulanan. Kecocokan rollup harian dengan day.csv bisa
+dicek dengan::
+
+    python -m bikeshare.aggregates --verify
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from bikeshare import schema
+
+CUBE_DIMENSIONS = ['dteday', 'hr', 'holiday', 'weathersit', 'season']
+CUBE_MEASURES = ['casual', 'registered', 'cnt']
+
+# Kolom kalender yang sama untuk semua jam dalam satu hari
+DAY_CALENDAR = ['season', 'yr', 'mnth', 'holiday', 'weekday', 'workingday']
+# Ukuran cuaca harian = rata-rata per jam
+DAY_MEANS = ['temp', 'atemp', 'hum', 'windspeed']
+DAY_COLUMNS = ['instant', 'dteday'] + DAY_CALENDAR + ['weathersit'] + DAY_MEANS + CUBE_MEASURES + ['month']
+
+# Kolom per jam yang dibaca cube dan rollup harian (sisanya tidak perlu dimuat, lihat ``ColumnStore.frame``)
+CUBE_COLUMNS = CUBE_DIMENSIONS + CUBE_MEASURES
+ROLLUP_COLUMNS = ['dteday'] + DAY_CALENDAR + ['weathersit'] + DAY_MEANS + CUBE_MEASURES
+
+# Level rollup: 'D' harian, 'W' mingguan (mulai Senin), 'M' bulanan
+ROLLUP_FREQS = ('D', 'W', 'M')
+
+
+def partial_cube(hour_data):
+    """Cube parsial (belum diurutkan/di-index) dari sebagian baris; gabungkan dengan ``merge_cubes``."""
+    return hour_data.groupby(CUBE_DIMENSIONS, observed=True, sort=False)[CUBE_MEASURES].sum().reset_index()
+
+
+def merge_cubes(partials):
+    """Menggabungkan cube parsial: jumlah per kombinasi dimensi dijumlahkan lagi."""
+    return partial_cube(pd.concat(partials, ignore_index=True))
+
+
+def finish_cube(partial):
+    """Cube final: terurut dengan index tanggal, hitungan int32."""
+    cube = partial.sort_values(CUBE_DIMENSIONS, ignore_index=True)
+    # Jumlah hasil groupby bertipe int64; int32 cukup untuk total per jam per hari
+    cube = cube.astype({measure: 'int32' for measure in CUBE_MEASURES})
+    return cube.set_index('dteday')
+
+
+def build_hourly_cube(hour_data):
+    """Mengelompokkan hour_data ke dimensi cube, dengan index tanggal yang terurut."""
+    return finish_cube(partial_cube(hour_data))
+
+
+def hourly_totals(cube, by, measure='cnt'):
+    """Total `measure` per jam dan per nilai kolom `by` (mis. 'holiday' atau 'weathersit').
+
+    `cube` boleh berupa potongan cube hasil filter (lihat ``IndexedFrame.select``).
+    """
+    return cube.groupby(['hr', by], observed=True)[measure].sum().reset_index()
+
+
+# Kolom rollup parsial yang dijumlahkan (rata-rata dihitung saat rollup diselesaikan)
+ROLLUP_SUMS = DAY_MEANS + ['weather_code'] + CUBE_MEASURES + ['hours']
+
+
+def _group_rollup(frame, key, calendar):
+    # Satu pengelompokan untuk semua kolom: kalender diambil nilai pertamanya, sisanya dijumlahkan
+    groups = frame.groupby(key, sort=False)
+    periods = groups[ROLLUP_SUMS].sum()
+    if calendar:
+        periods = groups[calendar].first().join(periods)
+    return periods.reset_index()
+
+
+def partial_rollup(hour_data, freq='D'):
+    """Rollup parsial per periode `freq` dalam satu groupby: jumlah (bukan rata-rata) plus jumlah jam.
+
+    Hasil dari beberapa potong data bisa digabung dengan ``merge_rollups`` lalu
+    diselesaikan dengan ``finish_rollup``.
+    """
+    if freq not in ROLLUP_FREQS:
+        raise ValueError(f'Level rollup tidak dikenal: {freq!r} (pilihan: {", ".join(ROLLUP_FREQS)})')
+    dates = hour_data['dteday']
+    key = dates if freq == 'D' else dates.dt.to_period(freq).dt.start_time
+    calendar = DAY_CALENDAR if freq == 'D' else []
+
+    columns = hour_data[calendar + DAY_MEANS + CUBE_MEASURES].astype({col: 'float64' for col in DAY_MEANS}).assign(
+        weather_code=hour_data['weathersit'].cat.codes.astype('float64') + 1,
+        hours=1,
+    )
+    return _group_rollup(columns, key.rename('dteday'), calendar)
+
+
+def merge_rollups(partials):
+    """Menggabungkan rollup parsial (mis. dari potongan data yang berbeda) menjadi satu rollup parsial."""
+    merged = pd.concat(partials, ignore_index=True)
+    return _group_rollup(merged, 'dteday', [col for col in DAY_CALENDAR if col in merged.columns])
+
+
+def finish_rollup(partial):
+    """Rollup final dari rollup parsial: rata-rata ukuran cuaca dan kode cuaca harian.
+
+    Kode cuaca adalah rata-rata kode per jam dibulatkan ke atas pada .5 (cocok dengan day.csv).
+    """
+    periods = partial.sort_values('dteday', ignore_index=True)
+    hours = periods.pop('hours').to_numpy()
+    for col in DAY_MEANS:
+        periods[col] = (periods[col].to_numpy() / hours).astype('float32')
+    periods = periods.astype({col: 'int32' for col in CUBE_MEASURES})
+    weather_codes = np.floor(periods.pop('weather_code').to_numpy() / hours + 0.5).astype('int8')
+    calendar = [col for col in DAY_CALENDAR if col in periods.columns]
+    periods.insert(len(calendar) + 1, 'weathersit', schema.codes_to_labels(weather_codes, schema.WEATHER_DTYPE))
+    return periods
+
+
+def rollup(hour_data, freq='D'):
+    """Rollup `hour_data` per periode `freq` (lihat ``ROLLUP_FREQS``) dalam satu groupby.
+
+    Hitungan dijumlahkan dan ukuran cuaca dirata-rata. Kolom ``dteday`` berisi
+    tanggal awal periode. Rollup harian juga membawa kolom kalender (musim,
+    hari libur, ...), yang tidak bermakna per minggu/bulan.
+    """
+    return finish_rollup(partial_rollup(hour_data, freq))
+
+
+def days_from_rollup(days, first_instant=1):
+    """Rollup harian final menjadi frame dengan kolom day.csv; `instant` diberi nomor urut mulai `first_instant`."""
+    days['instant'] = np.arange(first_instant, first_instant + len(days), dtype='int32')
+    days['month'] = days['dteday'].dt.month.astype('int8')
+    return days[DAY_COLUMNS]
+
+
+def rollup_days(hour_data, first_instant=1):
+    """Frame harian (kolom sama dengan day.csv yang disiapkan) dari `hour_data` yang sudah disiapkan."""
+    return days_from_rollup(rollup(hour_data, 'D'), first_instant)
+
+
+def aggregate_chunks(chunks):
+    """(frame harian, cube) dari iterasi potongan `hour_data`, tanpa memuat semuanya sekaligus.
+
+    Setiap potongan diringkas menjadi agregat parsial lalu digabung dengan
+    agregat sebelumnya, jadi memori puncak sebanding dengan ukuran potongan
+    ditambah ukuran agregat (jumlah hari x jam), bukan jumlah baris data.
+    """
+    days, cube = None, None
+    for chunk in chunks:
+        chunk_days, chunk_cube = partial_rollup(chunk, 'D'), partial_cube(chunk)
+        days = chunk_days if days is None else merge_rollups([days, chunk_days])
+        cube = chunk_cube if cube is None else merge_cubes([cube, chunk_cube])
+    return days_from_rollup(finish_rollup(days)), finish_cube(cube)
+
+
+def compare_days(rolled, day_data, atol=1e-6):
+    """Nama kolom yang berbeda antara rollup harian dan day.csv (ukuran cuaca dengan toleransi `atol`)."""
+    if len(rolled) != len(day_data):
+        return ['(jumlah baris)']
+    different = []
+    for col in DAY_COLUMNS:
+        a, b = rolled[col].reset_index(drop=True), day_data[col].reset_index(drop=True)
+        if col in DAY_MEANS:
+            same = np.allclose(a.to_numpy(), b.to_numpy(), atol=atol)
+        else:
+            same = a.equals(b)
+        if not same:
+            different.append(col)
+    return different
+
+
+def main():
+    from bikeshare.loader import DAY_CSV, HOUR_CSV, read_day_csv, read_hour_csv
+
+    parser = argparse.ArgumentParser(description='Rollup data per jam ke harian/mingguan/bulanan.')
+    parser.add_argument('--verify', action='store_true', help='bandingkan rollup harian dengan day.csv')
+    parser.add_argument('--freq', choices=ROLLUP_FREQS, default='D', help='level rollup yang dicetak')
+    args = parser.parse_args()
+
+    hour_data = read_hour_csv(HOUR_CSV)
+    if args.verify:
+        different = compare_days(rollup_days(hour_data), read_day_csv(DAY_CSV))
+        if different:
+            raise SystemExit(f'Rollup berbeda dengan day.csv pada kolom: {", ".join(different)}')
+        print('Rollup harian sama dengan day.csv')
+    else:
+        print(rollup(hour_data, args.freq).to_string(max_rows=20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark cold-load CSV vs snapshot kolumnar vs column store .npy vs agregasi per potongan.
+
+Setiap pengukuran dijalankan di proses Python baru agar benar-benar "dingin"
+(tanpa cache Streamlit maupun cache halaman Python). Dataset yang diuji adalah
+hour.csv asli dan salinan yang direplikasi N kali. Mode ``chunked`` tidak
+menyimpan baris mentah; kolom rows-nya berisi jumlah baris cube hasil agregasi.
+Mode ``npy`` hanya membuka column store (memory map); ``npy-holiday`` juga
+menghitung data grafik hari libur sehingga kolom ``hr``, ``holiday`` dan
+``cnt`` benar-benar dibaca.
+
+Mode ``loader`` dan ``loader-npy`` mengukur jalur yang benar-benar dipakai
+dashboard: ``load_day_data`` dan ``load_hourly_cube`` (rollup harian dan cube
+per jam), masing-masing dari snapshot dan dari column store
+(``BIKESHARE_COLUMN_STORE=1``, hanya kolom yang dipakai agregasi yang
+dibaca). Seperti ``chunked``, kolom rows-nya berisi jumlah baris cube.
+
+Contoh::
+
+    python -m bikeshare.benchmark --replicate 100
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from bikeshare.procstat import peak_rss_mb, rss_mb
+
+# Ukuran potongan untuk mode chunked
+CHUNK_ROWS = 200_000
+
+# Mode jalur loader dashboard -> environment tambahan untuk subprosesnya
+LOADER_MODES = {
+    'loader': {'BIKESHARE_COLUMN_STORE': '0'},
+    'loader-npy': {'BIKESHARE_COLUMN_STORE': '1'},
+}
+
+
+def _load_once(mode, csv_path):
+    """Dijalankan di subproses: memuat sekali lalu mencetak hasil pengukuran sebagai JSON."""
+    from bikeshare import aggregates, colstore, snapshot
+    from bikeshare.loader import file_fingerprint, read_hour_chunks, read_hour_csv
+
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    if mode == 'csv':
+        frame = read_hour_csv(csv_path)
+        rows = len(frame)
+    elif mode in ('npy', 'npy-holiday'):
+        store = colstore.ColumnStore(os.path.join(colstore.store_dir(csv_path), file_fingerprint(csv_path)))
+        frame = store.frame()
+        if mode == 'npy-holiday':
+            aggregates.hourly_totals(frame, 'holiday')
+        rows = len(frame)
+    elif mode == 'chunked':
+        _, cube = aggregates.aggregate_chunks(read_hour_chunks(csv_path, CHUNK_ROWS))
+        rows = len(cube)
+    elif mode in LOADER_MODES:
+        from bikeshare.loader import load_day_data, load_hourly_cube
+
+        load_day_data(csv_path)
+        rows = len(load_hourly_cube(csv_path))
+    else:
+        frame = snapshot.read_snapshot(csv_path)
+        rows = len(frame)
+    seconds = time.perf_counter() - start
+    print(json.dumps({
+        'mode': mode,
+        'rows': rows,
+        'seconds': seconds,
+        'rss_mb': rss_mb() - rss_before,
+        'peak_rss_mb': peak_rss_mb(),
+    }))
+
+
+def measure(mode, csv_path):
+    output = subprocess.run(
+        [sys.executable, '-m', 'bikeshare.benchmark', '--load-once', mode, csv_path],
+        check=True, capture_output=True, text=True,
+        # Data dashboard tidak dibagi antar proses dan tidak dibaca per potongan agar jalurnya sama untuk semua mode
+        env={**os.environ, 'BIKESHARE_SHARED_DIR': '', 'BIKESHARE_CHUNK_ROWS': '0', **LOADER_MODES.get(mode, {})},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def replicate_csv(csv_path, times, out_path):
+    """Menulis salinan CSV yang isinya diulang `times` kali (nomor `instant` dilanjutkan)."""
+    frame = pd.read_csv(csv_path)
+    with open(out_path, 'w', newline='') as f:
+        for i in range(times):
+            chunk = frame.assign(instant=frame['instant'] + i * len(frame))
+            chunk.to_csv(f, index=False, header=(i == 0))
+    return out_path
+
+
+def run(csv_path, replicate):
+    from bikeshare import colstore, snapshot
+    from bikeshare.loader import file_fingerprint, read_hour_chunks, read_hour_csv
+
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets = [('hour.csv', csv_path)]
+        if replicate > 1:
+            datasets.append((f'hour.csv x{replicate}', replicate_csv(csv_path, replicate, os.path.join(tmp, 'hour.csv'))))
+
+        print(f"{'dataset':<16} {'mode':<11} {'rows':>10} {'detik':>8} {'RSS MB':>8} {'puncak MB':>10}")
+        for name, path in datasets:
+            # Pastikan snapshot dan column store ada sebelum diukur
+            fingerprint = file_fingerprint(path)
+            snapshot.load_frame(path, fingerprint, read_hour_csv)
+            if not colstore.is_fresh(path, fingerprint):
+                colstore.convert(path, read_hour_chunks(path), fingerprint)
+            for mode in ('csv', 'snapshot', 'npy', 'npy-holiday', 'chunked', *LOADER_MODES):
+                r = measure(mode, path)
+                print(f"{name:<16} {mode:<11} {r['rows']:>10} {r['seconds']:>8.3f} {r['rss_mb']:>8.1f} {r['peak_rss_mb']:>10.1f}")
+
+
+def main():
+    from bikeshare.loader import HOUR_CSV
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--csv', default=HOUR_CSV)
+    parser.add_argument('--replicate', type=int, default=100, help='faktor replikasi hour.csv (default 100)')
+    parser.add_argument('--load-once', nargs=2, metavar=('MODE', 'CSV'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load_once:
+        _load_once(*args.load_once)
+    else:
+        run(args.csv, args.replicate)
+
+
+if __name__ == '__main__':
+    main()
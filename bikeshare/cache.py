@@ -0,0 +1,79 @@
+"""Cache LRU sederhana yang aman dipakai banyak thread (sesi Streamlit).
+
+Objek cache dibuat di level modul sehingga dipakai bersama oleh semua sesi
+dalam satu proses. Batasnya jumlah entri dan, jika ``sizeof`` diberikan,
+total ukuran nilai (mis. jumlah byte gambar). Penghitung hit/miss/eviction
+tersedia lewat ``stats()`` untuk menentukan ukuran cache yang pas.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, max_entries, max_bytes=None, sizeof=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """Nilai untuk `key`; jika belum ada, `compute()` dipanggil (di luar lock) lalu disimpan."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._sizes[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.total_bytes += size
+            # Entri terbaru selalu disimpan meskipun sendirian sudah melewati max_bytes
+            while len(self._entries) > 1 and self._over_limit():
+                old_key, _ = self._entries.popitem(last=False)
+                self.total_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def _over_limit(self):
+        if len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,97 @@
+"""Fungsi penggambar grafik matplotlib/seaborn untuk setiap bagian dashboard.
+
+Setiap fungsi menerima data yang sudah diagregasi/difilter dan mengembalikan
+``Figure``. Dashboard tidak memanggilnya langsung, melainkan lewat
+``bikeshare.figures.render_png`` agar hasil render bisa di-cache dan
+figure-nya dilepas setelah dirender.
+"""
+import seaborn as sns
+from matplotlib import colormaps
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+
+from bikeshare.figures import subplots
+
+
+def monthly_chart(monthly_data):
+    # Membuat grafik dengan warna berdasarkan musim dan cuaca
+    fig, ax = subplots(figsize=(12, 6))
+    sns.lineplot(data=monthly_data, x='Month', y='Total Peminjaman', hue='Season', style='Weather', markers=True, ax=ax)
+    ax.set_title('Jumlah Peminjaman Sepeda per Bulan Berdasarkan Musim dan Cuaca')
+    ax.set_xlabel('Bulan')
+    ax.set_ylabel('Jumlah Peminjaman Sepeda')
+    return fig
+
+
+def temp_hum_scatter(data):
+    fig, ax = subplots(figsize=(10, 6))
+    sns.scatterplot(data=data, x='temp', y='hum', hue='weathersit', style='season', size='cnt', ax=ax, palette='Set1')
+    ax.set_title('Pengaruh Suhu dan Kelembaban terhadap Jumlah Peminjaman')
+    ax.set_xlabel('Suhu (°C)')
+    ax.set_ylabel('Kelembaban (%)')
+    return fig
+
+
+def temp_hum_density(binned):
+    """Versi scatter untuk data besar: warna sel = rata-rata cnt (lihat ``bikeshare.sampling.bin_mean``)."""
+    fig, ax = subplots(figsize=(10, 6))
+    norm = Normalize(binned['cnt'].min(), binned['cnt'].max())
+    cmap = colormaps['viridis']
+    # Satu persegi per sel grid yang berisi data
+    ax.bar(binned['temp_lo'], binned['hum_hi'] - binned['hum_lo'], width=binned['temp_hi'] - binned['temp_lo'],
+           bottom=binned['hum_lo'], align='edge', color=cmap(norm(binned['cnt'])), linewidth=0)
+    fig.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax, label='Rata-rata cnt')
+    ax.set_title('Pengaruh Suhu dan Kelembaban terhadap Jumlah Peminjaman')
+    ax.set_xlabel('Suhu (°C)')
+    ax.set_ylabel('Kelembaban (%)')
+    return fig
+
+
+def hourly_holiday_chart(data_working_day, data_holiday):
+    fig, ax = subplots(figsize=(10, 6))
+
+    # Menggunakan log scale untuk sumbu Y untuk perbedaan besar
+    ax.set_yscale('log')
+
+    # Plot untuk hari kerja dan hari libur terpisah
+    sns.lineplot(data=data_working_day, x='hr', y='cnt', label='Hari Kerja', ax=ax)
+    sns.lineplot(data=data_holiday, x='hr', y='cnt', label='Hari Libur', ax=ax)
+
+    ax.set_title('Jumlah Peminjaman per Jam Berdasarkan Hari Libur')
+    ax.set_xlabel('Jam')
+    ax.set_ylabel('Jumlah Peminjaman Sepeda (Log Scale)')
+    ax.legend(title='Hari', loc='upper left')
+    return fig
+
+
+def hourly_weather_chart(hourly_weather_data):
+    fig, ax = subplots(figsize=(10, 6))
+
+    # Plot dengan menggunakan seaborn
+    sns.lineplot(data=hourly_weather_data, x='hr', y='cnt', hue='weathersit', ax=ax)
+
+    ax.set_title('Jumlah Peminjaman Sepeda per Jam Berdasarkan Cuaca')
+    ax.set_xlabel('Jam')
+    ax.set_ylabel('Jumlah Peminjaman Sepeda')
+
+    # Label cuaca sudah deskriptif dari skema (bikeshare.schema.WEATHER_LABELS)
+    ax.legend(title='Kondisi Cuaca')
+    return fig
+
+
+def rfm_histograms(rfm_data):
+    # Displaying RFM distributions
+    fig, axes = subplots(1, 3, figsize=(15, 5))
+
+    # Recency
+    axes[0].hist(rfm_data['Recency'], bins=30, color='skyblue')
+    axes[0].set_title('Distribusi Recency')
+
+    # Frequency
+    axes[1].hist(rfm_data['Frequency'], bins=30, color='orange')
+    axes[1].set_title('Distribusi Frequency')
+
+    # Monetary
+    axes[2].hist(rfm_data['Monetary'], bins=30, color='green')
+    axes[2].set_title('Distribusi Monetary')
+    return fig
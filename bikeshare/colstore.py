@@ -0,0 +1,142 @@
+"""Column store sederhana untuk hour.csv: satu file ``.npy`` per kolom plus manifest.
+
+Kolom dibuka dengan ``np.load(mmap_mode='r')`` dan frame dibangun tanpa
+menyalin data, jadi membuka store hampir instan dan sistem operasi hanya
+memuat halaman kolom yang benar-benar dipakai (misalnya ``hr``, ``holiday``
+dan ``cnt`` untuk grafik hari libur). Kolom kategorikal disimpan sebagai kode
+int8 dengan daftar label di manifest; kode ini divalidasi pandas saat frame
+dibangun, jadi kolom label (1 byte per baris) selalu ikut terbaca.
+
+Setiap versi data ditulis ke subfolder bernama fingerprint CSV sumber;
+manifest ditulis terakhir, jadi subfolder tanpa manifest dianggap belum jadi.
+
+Konversi dari CSV::
+
+    python -m bikeshare.colstore
+"""
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = 'manifest.json'
+COLSTORE_VERSION = 1
+
+
+def store_dir(csv_path):
+    """Folder column store untuk sebuah CSV: data/columns/<nama>/."""
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(os.path.dirname(csv_path), 'columns', name)
+
+
+def count_rows(csv_path):
+    """Jumlah baris data (tanpa header), dihitung dari jumlah baris baru tanpa mem-parsing CSV."""
+    lines, last = 0, b'\n'
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            lines += block.count(b'\n')
+            last = block[-1:]
+    return lines - 1 + (last != b'\n')
+
+
+def _column_spec(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return {'dtype': 'int8', 'categories': list(series.cat.categories)}
+    return {'dtype': str(series.dtype)}
+
+
+def _column_values(series):
+    return series.cat.codes.to_numpy() if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+
+
+def convert(csv_path, chunks, fingerprint, directory=None):
+    """Menulis potongan frame (`chunks`, sudah disiapkan) ke column store; mengembalikan foldernya.
+
+    Kolom diisi langsung ke file ``.npy`` yang di-memory-map, jadi memori
+    hanya sebesar satu potongan.
+    """
+    root = directory or store_dir(csv_path)
+    target = os.path.join(root, fingerprint)
+    shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(target)
+
+    rows = count_rows(csv_path)
+    columns, files, filled = {}, {}, 0
+    for chunk in chunks:
+        if not files:
+            for name in chunk.columns:
+                columns[name] = {**_column_spec(chunk[name]), 'file': f'{name}.npy'}
+                files[name] = np.lib.format.open_memmap(
+                    os.path.join(target, f'{name}.npy'), mode='w+', dtype=columns[name]['dtype'], shape=(rows,),
+                )
+        for name, out in files.items():
+            out[filled:filled + len(chunk)] = _column_values(chunk[name])
+        filled += len(chunk)
+
+    for name, out in files.items():
+        out.flush()
+        if filled < rows:
+            # Baris kosong di CSV tidak ikut terbaca: potong file ke jumlah baris sebenarnya
+            np.save(os.path.join(target, f'{name}.npy'), np.array(out[:filled]))
+    files.clear()
+
+    manifest = {'version': COLSTORE_VERSION, 'source_fingerprint': fingerprint, 'rows': filled, 'columns': columns}
+    tmp_path = os.path.join(target, f'{MANIFEST}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, os.path.join(target, MANIFEST))
+
+    # Versi lama tidak dipakai lagi
+    for entry in os.listdir(root):
+        if entry != fingerprint:
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return target
+
+
+def is_fresh(csv_path, fingerprint, directory=None):
+    return os.path.exists(os.path.join(directory or store_dir(csv_path), fingerprint, MANIFEST))
+
+
+class ColumnStore:
+    """Column store yang sudah dikonversi; kolom dibuka sebagai memory map saat pertama diminta."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.columns = list(self.manifest['columns'])
+        self._arrays = {}
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    def array(self, name):
+        """Array kolom `name` (memory map read-only; kode untuk kolom kategorikal)."""
+        if name not in self._arrays:
+            spec = self.manifest['columns'][name]
+            self._arrays[name] = np.load(os.path.join(self.path, spec['file']), mmap_mode='r')
+        return self._arrays[name]
+
+    def column(self, name):
+        spec = self.manifest['columns'][name]
+        values = self.array(name)
+        if 'categories' in spec:
+            return pd.Categorical.from_codes(values, dtype=pd.CategoricalDtype(spec['categories']))
+        return values
+
+    def frame(self, columns=None):
+        """Frame dari kolom `columns` (semua jika None) tanpa menyalin kolom numerik."""
+        return pd.DataFrame({name: self.column(name) for name in columns or self.columns}, copy=False)
+
+
+def main():
+    from bikeshare.loader import HOUR_CSV, file_fingerprint, read_hour_chunks
+
+    path = convert(HOUR_CSV, read_hour_chunks(HOUR_CSV), file_fingerprint(HOUR_CSV))
+    print(f'{HOUR_CSV} -> {path} ({len(ColumnStore(path))} baris)')
+
+
+if __name__ == '__main__':
+    main()
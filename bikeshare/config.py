@@ -0,0 +1,50 @@
+"""Pengaturan dashboard dari environment variable (semuanya opsional)."""
+import os
+
+# Jumlah hasil node dataflow (filter dan data tiap grafik) yang disimpan di cache bersama
+NODE_CACHE_SIZE = int(os.environ.get('BIKESHARE_NODE_CACHE_SIZE', 256))
+
+# '1': selalu tampilkan panel debug (waktu per tahap, node dataflow, profil); tanpa ini panel hanya muncul dengan ?debug=1
+DEBUG = os.environ.get('BIKESHARE_DEBUG', '0') == '1'
+
+# File JSON Lines tempat record waktu setiap rerun ditambahkan; kosong = hanya ke logger bikeshare.profiling
+TIMING_LOG = os.environ.get('BIKESHARE_TIMING_LOG', '')
+
+# Folder tempat profil cProfile (.prof) rerun yang diprofilkan disimpan
+PROFILE_DIR = os.environ.get('BIKESHARE_PROFILE_DIR', 'profiles')
+
+# Cache gambar grafik yang sudah dirender (PNG): batas jumlah gambar dan total ukuran
+FIGURE_CACHE_SIZE = int(os.environ.get('BIKESHARE_FIGURE_CACHE_SIZE', 256))
+FIGURE_CACHE_MB = float(os.environ.get('BIKESHARE_FIGURE_CACHE_MB', 64))
+
+# Backend grafik: 'matplotlib' (PNG dirender di server) atau 'vega' (Vega-Lite dirender di browser)
+CHART_BACKEND = os.environ.get('BIKESHARE_CHART_BACKEND', 'matplotlib').lower()
+
+# Di atas jumlah titik ini scatter suhu/kelembaban direduksi: 'bins' (grid rata-rata cnt) atau 'sample'
+SCATTER_MAX_POINTS = int(os.environ.get('BIKESHARE_SCATTER_MAX_POINTS', 5000))
+SCATTER_REDUCTION = os.environ.get('BIKESHARE_SCATTER_REDUCTION', 'bins').lower()
+
+# Jumlah kelas skor RFM (3: Low/Medium/High)
+RFM_BINS = int(os.environ.get('BIKESHARE_RFM_BINS', 3))
+
+# '1': hour.csv dibaca sebagai feed yang terus bertambah (baris baru dimuat inkremental,
+# data harian diturunkan dari data per jam) alih-alih memuat ulang file saat berubah
+LIVE_FEED = os.environ.get('BIKESHARE_LIVE_FEED', '0') == '1'
+
+# Jika > 0, hour.csv dibaca per potongan sebanyak ini baris dan hanya agregatnya yang disimpan
+# (memori puncak dibatasi ukuran potongan, bukan ukuran dataset)
+CHUNK_ROWS = int(os.environ.get('BIKESHARE_CHUNK_ROWS', 0))
+
+# Penyimpanan data: 'memory' (frame pandas per proses) atau 'sqlite' (satu file database bersama,
+# filter dan agregasi dijalankan sebagai query)
+STORE = os.environ.get('BIKESHARE_STORE', 'memory').lower()
+
+# Folder bersama (sebaiknya tmpfs, mis. /dev/shm/bikeshare) tempat frame harian dan cube ditulis sekali
+# lalu di-memory-map oleh semua proses worker; kosong = setiap proses menyimpan salinannya sendiri
+SHARED_DIR = os.environ.get('BIKESHARE_SHARED_DIR', '')
+
+# File data per jam yang dipakai dashboard; kosong = data/hour.csv (mis. data sintetis dari bikeshare.synth)
+HOUR_CSV = os.environ.get('BIKESHARE_HOUR_CSV', '')
+
+# '1': frame per jam dibuka dari column store .npy yang di-memory-map (data/columns/), dibangun dari CSV jika perlu
+COLUMN_STORE = os.environ.get('BIKESHARE_COLUMN_STORE', '0') == '1'
@@ -0,0 +1,87 @@
+"""Mesin dataflow kecil: setiap artefak turunan dashboard adalah node dengan input yang dinyatakan.
+
+Input sebuah node adalah nilai sumber (widget, data yang dimuat) atau node lain.
+Kunci cache sebuah node disusun dari kunci input-inputnya secara rekursif
+sampai ke nilai sumber, tanpa perlu menghitung apa pun. Jadi saat satu widget
+berubah, hanya node yang (langsung atau tidak) bergantung padanya yang
+kuncinya berubah dan dihitung ulang; node lain diambil dari cache.
+
+Cache dipakai bersama oleh semua sesi: nilai node tidak boleh diubah in-place.
+Setiap ``Run`` mencatat node mana yang dijalankan atau diambil dari cache,
+beserta waktunya, untuk instrumentasi (lihat ``bikeshare.profiling``).
+"""
+import time
+from collections import namedtuple
+
+from bikeshare import config
+from bikeshare.cache import LRUCache
+
+Node = namedtuple('Node', ['name', 'inputs', 'func'])
+
+# status: 'ran' (dihitung) atau 'cached'; seconds: waktu node itu sendiri, tanpa input-inputnya
+NodeEvent = namedtuple('NodeEvent', ['node', 'status', 'seconds'])
+
+node_cache = LRUCache(config.NODE_CACHE_SIZE)
+
+
+def source_key(value):
+    """Bentuk nilai sumber yang bisa dipakai sebagai kunci cache (objek data diwakili token-nya)."""
+    if hasattr(value, 'token'):
+        return ('token', value.token)
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+class Graph:
+    def __init__(self, cache=node_cache):
+        self.nodes = {}
+        self.cache = cache
+
+    def node(self, *inputs):
+        """Dekorator: mendaftarkan fungsi sebagai node bernama sama, dengan `inputs` sebagai argumennya."""
+        def register(func):
+            self.nodes[func.__name__] = Node(func.__name__, inputs, func)
+            return func
+        return register
+
+    def run(self, **sources):
+        return Run(self, sources)
+
+
+class Run:
+    """Evaluasi graph untuk satu rerun dengan nilai sumber `sources`."""
+
+    def __init__(self, graph, sources):
+        self.graph = graph
+        self._keys = {name: ('source', name, source_key(value)) for name, value in sources.items()}
+        self._values = dict(sources)
+        self.events = []
+
+    def key(self, name):
+        if name not in self._keys:
+            node = self.graph.nodes[name]
+            self._keys[name] = (name,) + tuple(self.key(input_name) for input_name in node.inputs)
+        return self._keys[name]
+
+    def get(self, name):
+        """Nilai node (atau sumber) `name`; input hanya dievaluasi jika node ini tidak ada di cache."""
+        if name in self._values:
+            return self._values[name]
+        node = self.graph.nodes[name]
+        timing = []
+
+        def compute():
+            args = [self.get(input_name) for input_name in node.inputs]
+            start = time.perf_counter()
+            value = node.func(*args)
+            timing.append(time.perf_counter() - start)
+            return value
+
+        value = self.graph.cache.get_or_compute(self.key(name), compute)
+        self.events.append(NodeEvent(name, 'ran' if timing else 'cached', timing[0] if timing else 0.0))
+        self._values[name] = value
+        return value
+
+    def ran(self):
+        return [event.node for event in self.events if event.status == 'ran']
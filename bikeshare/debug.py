@@ -0,0 +1,65 @@
+"""Panel debug tersembunyi: waktu per tahap/bagian, node dataflow, dan profil cProfile sesuai permintaan.
+
+Panel hanya muncul jika URL memuat ``?debug=1`` atau ``BIKESHARE_DEBUG=1``.
+Tombol "Profilkan rerun berikutnya" menandai session state lewat callback,
+jadi rerun yang dipicu tombol itu sendiri diprofilkan dari baris pertama
+skrip. ``?profile=1`` di URL memprofilkan setiap rerun selama parameter itu ada.
+"""
+import os
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from bikeshare import config
+from bikeshare.profiling import RerunProfile
+
+PROFILE_NEXT = 'debug_profile_next'
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def enabled():
+    return config.DEBUG or st.query_params.get('debug') == '1'
+
+
+def start_rerun():
+    """Mulai mencatat rerun ini; cProfile dijalankan jika diminta lewat panel atau ``?profile=1``."""
+    profile = st.session_state.pop(PROFILE_NEXT, False) or st.query_params.get('profile') == '1'
+    return RerunProfile(session=_session_id(), profile=profile).start()
+
+
+def finish_rerun(profile, run=None):
+    return profile.finish(run, profile_dir=config.PROFILE_DIR, log_path=config.TIMING_LOG)
+
+
+def _request_profile():
+    st.session_state[PROFILE_NEXT] = True
+
+
+def show_debug_panel(profile):
+    """Menampilkan hasil `profile` (sudah diselesaikan) jika mode debug aktif."""
+    if not enabled():
+        return
+    with st.expander(f'Debug: rerun {profile.seconds * 1000:.0f} ms'):
+        st.markdown('**Tahap dan bagian** (waktu tahap induk sudah termasuk tahap di dalamnya)')
+        stages = pd.DataFrame([s for s in profile.stages if s], columns=['stage', 'depth', 'seconds'])
+        stages['stage'] = [' ' * depth + name for name, depth in zip(stages['stage'], stages['depth'])]
+        stages['ms'] = (stages.pop('seconds') * 1000).round(2)
+        st.dataframe(stages.drop(columns='depth'), use_container_width=True, hide_index=True)
+
+        st.markdown('**Node dataflow** (`ran`: dihitung pada rerun ini, `cached`: diambil dari cache)')
+        nodes = pd.DataFrame(profile.nodes, columns=['node', 'status', 'seconds'])
+        nodes['ms'] = (nodes.pop('seconds') * 1000).round(2)
+        st.dataframe(nodes, use_container_width=True, hide_index=True)
+
+        st.button('Profilkan rerun berikutnya', on_click=_request_profile, key='debug_profile_button')
+        if profile.profile_path:
+            st.caption(f'Profil cProfile rerun ini: `{profile.profile_path}`')
+            with open(profile.profile_path, 'rb') as f:
+                st.download_button('Unduh profil (.prof)', f.read(), file_name=os.path.basename(profile.profile_path),
+                                   key='debug_profile_download')
+            st.code(profile.top_functions(), language=None)
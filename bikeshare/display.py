@@ -0,0 +1,27 @@
+"""Menampilkan grafik dashboard dengan backend yang dipilih lewat konfigurasi.
+
+``BIKESHARE_CHART_BACKEND=matplotlib`` (bawaan) merender PNG di server
+(di-cache, lihat ``bikeshare.figures``); ``vega`` mengirim data teragregasi
+ke browser dan merendernya di sana dengan Vega-Lite.
+"""
+import streamlit as st
+
+from bikeshare import charts, config, vega_charts
+from bikeshare.figures import render_png
+from bikeshare.profiling import stage
+
+BACKENDS = ('matplotlib', 'vega')
+
+
+def show_chart(name, *frames, backend=None):
+    """Menampilkan grafik `name` (nama fungsi di ``bikeshare.charts``) dari `frames`."""
+    backend = backend or config.CHART_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f'Backend grafik tidak dikenal: {backend!r} (pilihan: {", ".join(BACKENDS)})')
+    # Waktu plotting sampai data/gambar diserahkan ke Streamlit untuk dikirim ke browser
+    with stage(f'chart:{name}'):
+        if backend == 'vega':
+            data, spec = getattr(vega_charts, name)(*frames)
+            st.vega_lite_chart(data, spec, use_container_width=True)
+        else:
+            st.image(render_png(name, getattr(charts, name), *frames), use_container_width=True)
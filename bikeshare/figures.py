@@ -0,0 +1,89 @@
+"""Cache gambar grafik yang sudah dirender.
+
+Kunci cache adalah nama grafik ditambah sidik jari data masukannya, sehingga
+grafik yang identik (mis. filter bawaan yang dipakai banyak sesi) langsung
+dikirim sebagai PNG tanpa menyentuh matplotlib sama sekali.
+
+Figure dibuat lewat ``subplots`` di modul ini, bukan ``plt.subplots``, jadi
+tidak pernah masuk registry global pyplot, dan dilepas segera setelah
+dirender. Tanpa itu setiap rerun di setiap sesi menambah figure yang tidak
+pernah ditutup.
+"""
+import hashlib
+import io
+import threading
+
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from bikeshare import config
+from bikeshare.cache import LRUCache
+
+figure_cache = LRUCache(config.FIGURE_CACHE_SIZE, max_bytes=int(config.FIGURE_CACHE_MB * 2**20), sizeof=len)
+
+# matplotlib tidak thread-safe (mis. parser mathtext untuk label sumbu log dipakai bersama), sedangkan
+# Streamlit menjalankan setiap sesi di thread sendiri: render grafik dijalankan satu per satu
+_render_lock = threading.Lock()
+
+# Opsi yang sama dengan st.pyplot agar tampilannya tidak berubah
+SAVEFIG_OPTIONS = {'format': 'png', 'bbox_inches': 'tight', 'dpi': 200}
+
+# st.image mengecilkan (decode, resize, encode ulang) setiap gambar yang lebih lebar
+# dari ini di SETIAP pemanggilan; jadi gambar dikecilkan sekali saja sebelum di-cache.
+MAX_IMAGE_WIDTH = 2 * 730
+
+
+def subplots(nrows=1, ncols=1, **fig_kw):
+    """Seperti ``plt.subplots`` tetapi Figure-nya tidak didaftarkan ke pyplot."""
+    fig = Figure(**fig_kw)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols)
+
+
+def release_figure(fig):
+    """Melepas figure beserta buffer render-nya (juga aman untuk figure dari pyplot)."""
+    plt.close(fig)
+    fig.clear()
+
+
+def data_fingerprint(*frames):
+    """Hash isi (nilai, index, nama dan tipe kolom) dari satu atau beberapa DataFrame."""
+    digest = hashlib.sha1()
+    for frame in frames:
+        digest.update(repr(list(zip(frame.columns, frame.dtypes.astype(str)))).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def figure_to_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **SAVEFIG_OPTIONS)
+    png = buffer.getvalue()
+
+    image = Image.open(io.BytesIO(png))
+    width, height = image.size
+    if width <= MAX_IMAGE_WIDTH:
+        return png
+    # Resampling yang sama dengan st.image agar hasilnya identik
+    image = image.resize((MAX_IMAGE_WIDTH, int(height * MAX_IMAGE_WIDTH / width)), resample=Image.BILINEAR)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _render(draw, frames):
+    with _render_lock:
+        fig = draw(*frames)
+        try:
+            return figure_to_png(fig)
+        finally:
+            release_figure(fig)
+
+
+def render_png(name, draw, *frames):
+    """PNG dari ``draw(*frames)``, diambil dari cache jika grafik yang sama sudah pernah dirender."""
+    key = (name, data_fingerprint(*frames))
+    return figure_cache.get_or_compute(key, lambda: _render(draw, frames))
@@ -0,0 +1,51 @@
+"""Filter dashboard: rentang tanggal, musim dan cuaca.
+
+Setiap filter adalah fungsi murni yang menjadi node di ``bikeshare.pipeline``.
+Filter musim/cuaca dijalankan oleh ``select`` milik backend data dalam satu
+langkah bersama rentang tanggal: mask dari kode kategori untuk
+``IndexedFrame``, klausa WHERE untuk tabel SQLite. Karena itu musim dan cuaca
+tidak dipecah menjadi node terpisah; memecahnya berarti menyaring frame hasil
+filter tanggal dengan ``isin`` di Python dan kehilangan pushdown ke SQLite.
+Hasil filter dipakai bersama oleh semua sesi: jangan diubah in-place.
+"""
+import pandas as pd
+
+from bikeshare import schema
+
+
+def _normalize_labels(labels, order):
+    selected = set(labels)
+    return tuple(label for label in order if label in selected)
+
+
+def normalize_filters(start_date, end_date, seasons, weather_conditions):
+    """Nilai filter yang tidak bergantung pada urutan pilihan atau tipe tanggal."""
+    return (
+        pd.Timestamp(start_date),
+        pd.Timestamp(end_date),
+        _normalize_labels(seasons, schema.SEASON_LABELS),
+        _normalize_labels(weather_conditions, schema.WEATHER_LABELS),
+    )
+
+
+def filter_dates(day_data, start_date, end_date):
+    """Baris harian dengan start_date <= tanggal <= end_date (pencarian biner pada index tanggal)."""
+    return day_data.filter_range(start_date, end_date)
+
+
+def finish_days(days):
+    """Data harian hasil filter yang siap dipakai grafik."""
+    # Label musim/cuaca kategorikal: buang label yang tidak terpilih agar tidak muncul di legenda
+    days = schema.drop_unused_labels(days)
+    # Menambahkan kolom 'hour' dari index tanggal untuk jam
+    return days.assign(hour=days.index.hour)
+
+
+def filter_days(day_data, start_date, end_date, seasons, weather_conditions):
+    """Data harian yang cocok dengan semua filter (kode kategori atau query, tergantung backend), siap dipakai grafik."""
+    return finish_days(day_data.select(start_date, end_date, season=seasons, weathersit=weather_conditions))
+
+
+def filter_hours(hourly_cube, start_date, end_date, seasons, weather_conditions):
+    """Potongan cube per jam yang cocok dengan semua filter (kode kategori atau query, tergantung backend)."""
+    return hourly_cube.select(start_date, end_date, season=seasons, weathersit=weather_conditions)
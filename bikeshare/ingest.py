@@ -0,0 +1,110 @@
+"""Pemuatan inkremental hour.csv yang terus ditambah baris baru (feed produksi).
+
+``HourFeed`` mengingat posisi byte terakhir yang sudah dibaca dan nomor
+``instant`` tertinggi (high-water mark). Setiap ``poll()`` hanya membaca byte
+baru sampai baris lengkap terakhir, mem-parsing delta itu saja, lalu
+memperbarui frame harian (rollup dari per jam) dan cube.
+
+Baris per jam mentah tidak disimpan. Yang disimpan adalah rollup harian
+parsial (jumlah, lihat ``aggregates.partial_rollup``) dan cube, keduanya bisa
+digabung dengan agregat delta. Hanya hari-hari yang tersentuh delta (biasanya
+hari terakhir yang belum lengkap plus hari baru) yang digabung ulang dan
+disambung ke bagian awal lewat ``IndexedFrame.with_tail``, jadi biaya setiap
+poll sebanding dengan ukuran delta, bukan ukuran data. Baris dengan
+``instant`` yang sudah pernah dimuat diabaikan, jadi membaca ulang sebagian
+file tidak menggandakan data.
+
+Jika file menyusut (diganti atau dipotong), semuanya dimuat ulang penuh.
+"""
+import io
+import os
+import threading
+
+import pandas as pd
+
+from bikeshare import aggregates, schema
+from bikeshare.query import IndexedFrame
+
+
+def read_hour_rows(data, names):
+    """Baris hour.csv (bytes tanpa header) menjadi frame yang sudah disiapkan."""
+    rows = schema.read_csv(io.BytesIO(data), schema.HOUR_DTYPES, names=names, header=None)
+    return schema.apply_labels(rows)
+
+
+class HourFeed:
+    """Frame harian dan cube yang diperbarui dari baris baru di `path`.
+
+    ``day_data`` dan ``hourly_cube`` diganti objek baru setiap ada data baru
+    (token baru, sehingga cache hasil filter lama tidak terpakai lagi);
+    objek lama tidak pernah diubah, jadi aman dipakai sesi lain yang sedang berjalan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._load_full()
+
+    def _load_full(self):
+        with open(self.path, 'rb') as f:
+            header = f.readline()
+            data = f.read()
+        self.names = header.decode().strip().split(',')
+        # Baris terakhir yang belum lengkap (masih ditulis) dibaca pada poll berikutnya
+        end = data.rfind(b'\n') + 1
+        self.offset = len(header) + end
+        hours = read_hour_rows(data[:end], self.names)
+        self.high_water = int(hours['instant'].max()) if len(hours) else 0
+        parts = aggregates.partial_rollup(hours)
+        self.day_parts = IndexedFrame(parts.set_index('dteday'), label_columns=())
+        self.day_data = IndexedFrame(aggregates.days_from_rollup(aggregates.finish_rollup(parts)).set_index('dteday'))
+        self.hourly_cube = IndexedFrame(aggregates.build_hourly_cube(hours))
+        return len(hours)
+
+    def _read_delta(self):
+        """Byte baru sejak `offset` sampai baris lengkap terakhir, atau None jika file menyusut."""
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            return None
+        if size == self.offset:
+            return b''
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b'\n') + 1
+        self.offset += end
+        return data[:end]
+
+    def poll(self):
+        """Membaca baris baru (jika ada) dan memperbarui frame; mengembalikan jumlah baris baru."""
+        with self._lock:
+            data = self._read_delta()
+            if data is None:
+                return self._load_full()
+            if not data:
+                return 0
+            delta = read_hour_rows(data, self.names)
+            delta = delta[delta['instant'] > self.high_water]
+            if delta.empty:
+                return 0
+            self._append(delta)
+            return len(delta)
+
+    def _append(self, delta):
+        self.high_water = int(delta['instant'].max())
+        # Agregat mulai hari paling awal yang tersentuh delta digabung dengan agregat delta.
+        # Baris yang datang tidak urut (hari lama) cukup memperpanjang bagian yang digabung ulang.
+        since = delta['dteday'].min()
+        parts = aggregates.merge_rollups([
+            self.day_parts.filter_range(since, pd.Timestamp.max).reset_index(),
+            aggregates.partial_rollup(delta),
+        ]).sort_values('dteday', ignore_index=True)
+        cube = aggregates.merge_cubes([
+            self.hourly_cube.filter_range(since, pd.Timestamp.max).reset_index(),
+            aggregates.partial_cube(delta),
+        ])
+        first_instant = self.day_data.position(since) + 1
+        days = aggregates.days_from_rollup(aggregates.finish_rollup(parts), first_instant).set_index('dteday')
+        self.day_parts = self.day_parts.with_tail(parts.set_index('dteday'))
+        self.day_data = self.day_data.with_tail(days)
+        self.hourly_cube = self.hourly_cube.with_tail(aggregates.finish_cube(cube))
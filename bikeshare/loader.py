@@ -0,0 +1,187 @@
+"""Lapisan data dashboard: memuat hour.csv sekali per proses.
+
+Frame yang sudah disiapkan dibagikan ke semua sesi Streamlit lewat
+``st.cache_resource`` dan hanya dimuat ulang jika isi file berubah. Frame
+harian (setara day.csv) dan cube agregat per jam sama-sama diturunkan dari
+hour.csv (``bikeshare.aggregates``), jadi hanya satu sumber mentah yang
+di-parse dan disimpan di memori. Bila
+snapshot kolumnar di data/snapshot/ masih segar, frame dibaca dari sana
+(lihat ``bikeshare.snapshot``); jika tidak, dari CSV.
+
+Untuk hour.csv yang terus ditambah baris baru, ``load_live_data`` memakai
+``bikeshare.ingest.HourFeed``: hanya baris baru yang dibaca di setiap rerun dan
+frame harian diturunkan dari data per jam.
+
+Jika ``BIKESHARE_CHUNK_ROWS`` diisi, hour.csv dibaca per potongan dan hanya
+agregatnya (frame harian dan cube) yang disimpan; frame per jam penuh tidak
+pernah ada di memori (lihat ``aggregates.aggregate_chunks``).
+
+Dengan ``BIKESHARE_COLUMN_STORE=1`` frame per jam dibuka dari column store
+``.npy`` yang di-memory-map (``bikeshare.colstore``) alih-alih snapshot/CSV.
+
+Dengan ``BIKESHARE_SHARED_DIR``, frame harian dan cube ditulis sekali ke folder
+bersama dan di-memory-map oleh semua proses worker (``bikeshare.shared``).
+
+Dengan ``BIKESHARE_STORE=sqlite`` data dibaca dari database SQLite di samping
+hour.csv (``bikeshare.store``) dan filter/agregasi dijalankan sebagai query.
+"""
+import hashlib
+import os
+
+import streamlit as st
+
+from bikeshare import aggregates, colstore, config, schema, shared, snapshot, store
+from bikeshare.ingest import HourFeed
+from bikeshare.query import IndexedFrame
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+DAY_CSV = os.path.join(DATA_DIR, 'day.csv')
+HOUR_CSV = os.path.abspath(config.HOUR_CSV) if config.HOUR_CSV else os.path.join(DATA_DIR, 'hour.csv')
+
+# path -> ((mtime_ns, size), sha1) agar hash isi file tidak dihitung setiap rerun
+_fingerprints = {}
+
+
+def file_fingerprint(path):
+    """Mengembalikan hash isi file; hash dihitung ulang hanya jika mtime atau ukuran berubah."""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _fingerprints.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    fingerprint = digest.hexdigest()
+    _fingerprints[path] = (key, fingerprint)
+    return fingerprint
+
+
+def prepare_day_data(day_data):
+    """Transformasi day.csv yang dipakai dashboard (label musim/cuaca, bulan)."""
+    day_data = schema.apply_labels(day_data)
+
+    # Menambahkan kolom 'month' untuk analisis bulanan
+    day_data['month'] = day_data['dteday'].dt.month.astype('int8')
+    return day_data
+
+
+def prepare_hour_data(hour_data):
+    """Transformasi hour.csv (label musim/cuaca)."""
+    return schema.apply_labels(hour_data)
+
+
+def read_day_csv(path=DAY_CSV):
+    return prepare_day_data(schema.read_csv(path, schema.DAY_DTYPES))
+
+
+def read_hour_csv(path=HOUR_CSV):
+    return prepare_hour_data(schema.read_csv(path, schema.HOUR_DTYPES))
+
+
+def read_hour_chunks(path=HOUR_CSV, rows=1_000_000):
+    """hour.csv per potongan `rows` baris, masing-masing sudah disiapkan."""
+    with schema.read_csv(path, schema.HOUR_DTYPES, chunksize=rows) as reader:
+        for chunk in reader:
+            yield prepare_hour_data(chunk)
+
+
+def _prepared(name, path, fingerprint, build):
+    """Frame hasil `build()`, atau salinan bersama antar proses jika ``BIKESHARE_SHARED_DIR`` diisi."""
+    if not config.SHARED_DIR:
+        return build()
+    return shared.load_shared(config.SHARED_DIR, f'{os.path.basename(path)}-{name}', fingerprint, build)
+
+
+# Cache dipakai bersama oleh semua sesi; fingerprint ikut menjadi kunci sehingga
+# perubahan isi file otomatis memicu parsing ulang.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _column_store(path, fingerprint):
+    if not colstore.is_fresh(path, fingerprint):
+        colstore.convert(path, read_hour_chunks(path), fingerprint)
+    return colstore.ColumnStore(os.path.join(colstore.store_dir(path), fingerprint))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_hour_data(path, fingerprint):
+    if config.COLUMN_STORE:
+        return _column_store(path, fingerprint).frame()
+    return snapshot.load_frame(path, fingerprint, read_hour_csv)
+
+
+def _hour_columns(path, fingerprint, columns):
+    """Data per jam untuk agregasi: dari column store hanya `columns` yang dibuka, selain itu frame penuh."""
+    if config.COLUMN_STORE:
+        return _column_store(path, fingerprint).frame(columns)
+    return _load_hour_data(path, fingerprint)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_day_data(path, fingerprint):
+    return IndexedFrame(_prepared('days', path, fingerprint, lambda: (
+        aggregates.rollup_days(_hour_columns(path, fingerprint, aggregates.ROLLUP_COLUMNS)).set_index('dteday')
+    )))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_hourly_cube(path, fingerprint):
+    return IndexedFrame(_prepared('cube', path, fingerprint, lambda: (
+        aggregates.build_hourly_cube(_hour_columns(path, fingerprint, aggregates.CUBE_COLUMNS))
+    )))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_chunked(path, fingerprint, rows):
+    days, cube = aggregates.aggregate_chunks(read_hour_chunks(path, rows))
+    return IndexedFrame(days.set_index('dteday')), IndexedFrame(cube)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_store(path, fingerprint):
+    db_path = store.store_path(path)
+    if not store.is_fresh(db_path, fingerprint):
+        store.build(db_path, read_hour_chunks(path), fingerprint)
+    return store.SqliteStore(db_path)
+
+
+# Satu feed per file untuk semua sesi; tidak di-key fingerprint karena isinya memang terus bertambah
+@st.cache_resource(show_spinner=False)
+def _hour_feed(path):
+    return HourFeed(path)
+
+
+def load_day_data(hour_path=HOUR_CSV):
+    """Frame harian (``IndexedFrame`` ber-index dteday), rollup dari data per jam di `hour_path`.
+
+    Tidak ada day.csv yang dibaca. Jangan diubah in-place: objeknya dipakai bersama.
+    """
+    if config.CHUNK_ROWS:
+        return _load_chunked(hour_path, file_fingerprint(hour_path), config.CHUNK_ROWS)[0]
+    return _load_day_data(hour_path, file_fingerprint(hour_path))
+
+
+def load_hour_data(path=HOUR_CSV):
+    """Frame per jam. Jangan diubah in-place: objeknya dipakai bersama."""
+    return _load_hour_data(path, file_fingerprint(path))
+
+
+def load_hourly_cube(path=HOUR_CSV):
+    """Cube agregat per jam dari hour.csv (``IndexedFrame``), dibangun sekali per versi file."""
+    if config.CHUNK_ROWS:
+        return _load_chunked(path, file_fingerprint(path), config.CHUNK_ROWS)[1]
+    return _load_hourly_cube(path, file_fingerprint(path))
+
+
+def load_live_data(path=HOUR_CSV):
+    """(frame harian, cube per jam) dari hour.csv yang terus bertambah; baris baru dimuat setiap dipanggil."""
+    feed = _hour_feed(path)
+    feed.poll()
+    return feed.day_data, feed.hourly_cube
+
+
+def load_store_data(path=HOUR_CSV):
+    """(tabel harian, cube per jam) di database SQLite; dibangun dari hour.csv jika belum ada atau usang."""
+    db = _load_store(path, file_fingerprint(path))
+    return db.days, db.hours
@@ -0,0 +1,169 @@
+"""Load test: banyak sesi dashboard.py bersamaan dalam satu proses, seperti satu ``streamlit run``.
+
+Setiap sesi adalah ``AppTest`` sendiri yang dijalankan di thread sendiri dan
+memutar ulang interaksi acak (rentang tanggal, musim, cuaca; lihat
+``soak.random_filters``). Dengan ``--combos N`` semua sesi memilih dari N
+kombinasi filter yang sama, sehingga sebagian rerun dilayani cache; tanpa
+itu setiap interaksi memakai filter baru (kasus terburuk). Semua sesi berbagi cache proses (data, node
+dataflow, gambar) seperti sesi-sesi di server Streamlit sungguhan, dan
+bersaing untuk GIL yang sama.
+
+Setiap jumlah sesi diukur di proses Python baru setelah satu rerun pemanasan
+(data sudah dimuat). Dilaporkan latensi rerun p50/p95/p99, throughput rerun,
+pemakaian CPU proses (detik CPU per detik wall = jumlah core yang terpakai),
+puncak RSS dan tambahan RSS per sesi.
+
+Contoh::
+
+    python -m bikeshare.loadtest --sessions 1,2,4,8 --reruns 20
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.testing.v1 import AppTest
+
+from bikeshare.procstat import peak_rss_mb, reset_peak_rss, rss_mb
+from bikeshare.soak import DASHBOARD, SECTION_KEYS, random_filters, set_filters
+
+DEFAULT_SESSIONS = '1,2,4,8'
+
+
+def share_runtime():
+    """Memasang satu Runtime tiruan bersama untuk semua sesi.
+
+    ``AppTest.run`` memasang Runtime tiruan global di awal setiap run dan
+    melepasnya di akhir, jadi dengan sesi paralel sesi yang selesai lebih dulu
+    melepas Runtime sesi lain yang masih berjalan. Di sini ``Runtime.instance``
+    selalu mengembalikan satu Runtime tiruan (dengan media file manager dan
+    cache storage sungguhan), seperti satu server yang melayani banyak sesi.
+    """
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage('/mock/media'))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: runtime)
+    Runtime.exists = classmethod(lambda cls: True)
+
+
+def new_session():
+    at = AppTest.from_file(DASHBOARD, default_timeout=300)
+    at.session_state['sections'] = SECTION_KEYS
+    return at
+
+
+def _session(at, reruns, seed, combos, start, latencies, errors):
+    """Satu sesi: `reruns` interaksi acak berturut-turut; latensi setiap rerun ditambahkan ke `latencies`."""
+    rng = random.Random(seed)
+    try:
+        at.run()
+        min_date, max_date = at.date_input(key='start_date').min, at.date_input(key='start_date').max
+        # Kumpulan kombinasi dibangun dari seed bersama, jadi sama untuk semua sesi
+        pool_rng = random.Random(combos)
+        pool = [random_filters(pool_rng, min_date, max_date) for _ in range(combos)]
+    except Exception as exc:
+        # Sesi yang gagal dibuka tetap harus mencapai barrier agar sesi lain tidak menunggu selamanya
+        errors.append(repr(exc))
+        start.wait()
+        return
+    start.wait()
+    for _ in range(reruns):
+        set_filters(at, rng.choice(pool) if pool else random_filters(rng, min_date, max_date))
+        begin = time.perf_counter()
+        at.run()
+        latencies.append(time.perf_counter() - begin)
+        if at.exception:
+            errors.append(at.exception[0].message)
+
+
+def run_level(sessions, reruns, seed, combos=0):
+    """Dijalankan di subproses: `sessions` sesi paralel; mengembalikan ringkasan pengukuran."""
+    share_runtime()
+    # Pemanasan: data dimuat dan disiapkan sekali per proses, seperti server yang sudah berjalan
+    new_session().run()
+    rss_base = rss_mb()
+
+    latencies, errors = [], []
+    start = threading.Barrier(sessions + 1)
+    threads = [
+        threading.Thread(target=_session, args=(new_session(), reruns, seed + i, combos, start, latencies, errors))
+        for i in range(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    # Semua sesi sudah menjalankan rerun pertamanya; pengukuran dimulai bersamaan
+    start.wait()
+    reset_peak_rss()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (float('nan'),) * 3
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'error_samples': sorted(set(errors))[:3],
+        'p50_ms': p50 * 1000,
+        'p95_ms': p95 * 1000,
+        'p99_ms': p99 * 1000,
+        'reruns_per_second': len(latencies) / wall,
+        'cpu_cores': cpu / wall,
+        'peak_rss_mb': peak_rss_mb(),
+        'rss_per_session_mb': (rss_mb() - rss_base) / sessions,
+    }
+
+
+def measure(sessions, reruns, seed, combos=0):
+    output = subprocess.run(
+        [sys.executable, '-m', 'bikeshare.loadtest', '--run-level', str(sessions), '--reruns', str(reruns),
+         '--seed', str(seed), '--combos', str(combos)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', default=DEFAULT_SESSIONS, help=f'jumlah sesi paralel yang diuji (default {DEFAULT_SESSIONS})')
+    parser.add_argument('--reruns', type=int, default=20, help='interaksi per sesi (default 20)')
+    parser.add_argument('--combos', type=int, default=0,
+                        help='jumlah kombinasi filter bersama yang diputar (0 = filter baru di setiap interaksi)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='simpan hasil ke file JSON')
+    parser.add_argument('--run-level', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_level:
+        print(json.dumps(run_level(args.run_level, args.reruns, args.seed, args.combos)))
+        return
+
+    results = []
+    print(f"{'sesi':>5} {'rerun':>6} {'error':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rerun/s':>8} "
+          f"{'CPU core':>9} {'puncak MB':>10} {'MB/sesi':>8}")
+    for sessions in (int(n) for n in args.sessions.split(',')):
+        r = measure(sessions, args.reruns, args.seed, args.combos)
+        results.append(r)
+        print(f"{r['sessions']:>5} {r['reruns']:>6} {r['errors']:>6} {r['p50_ms']:>8.0f} {r['p95_ms']:>8.0f} "
+              f"{r['p99_ms']:>8.0f} {r['reruns_per_second']:>8.2f} {r['cpu_cores']:>9.2f} "
+              f"{r['peak_rss_mb']:>10.1f} {r['rss_per_session_mb']:>8.1f}", flush=True)
+        for message in r['error_samples']:
+            print(f'      error: {message}')
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
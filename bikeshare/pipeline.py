@@ -0,0 +1,99 @@
+"""Graph dataflow dashboard: sumber (data dan widget) -> filter -> data tiap grafik.
+
+Sumber: ``day_data``, ``hourly_cube``, ``start_date``, ``end_date``, ``seasons``,
+``weather_conditions`` (lihat ``sources``). Node untuk setiap grafik hanya
+bergantung pada node filter yang dipakainya, jadi misalnya tabel data (yang
+hanya memakai ``date_days``) tidak dihitung ulang saat musim atau cuaca berubah.
+Node ``days`` dan ``hours`` menyaring tanggal, musim dan cuaca sekaligus lewat
+``select`` backend data (lihat ``bikeshare.filters``).
+"""
+from bikeshare import config
+from bikeshare.aggregates import hourly_totals
+from bikeshare.dataflow import Graph
+from bikeshare.filters import filter_dates, filter_days, filter_hours, normalize_filters
+from bikeshare.rfm import reference_edges, rfm_scores
+from bikeshare.sampling import scatter_view
+from bikeshare.schema import drop_unused_labels
+
+flow = Graph()
+
+
+def sources(day_data, hourly_cube, start_date, end_date, seasons, weather_conditions):
+    """Nilai sumber graph; filter dinormalisasi agar urutan pilihan tidak membuat kunci cache baru."""
+    start_date, end_date, seasons, weather_conditions = normalize_filters(start_date, end_date, seasons, weather_conditions)
+    return {
+        'day_data': day_data,
+        'hourly_cube': hourly_cube,
+        'start_date': start_date,
+        'end_date': end_date,
+        'seasons': seasons,
+        'weather_conditions': weather_conditions,
+    }
+
+
+@flow.node('day_data', 'start_date', 'end_date')
+def date_days(day_data, start_date, end_date):
+    return filter_dates(day_data, start_date, end_date)
+
+
+@flow.node('day_data', 'start_date', 'end_date', 'seasons', 'weather_conditions')
+def days(day_data, start_date, end_date, seasons, weather_conditions):
+    return filter_days(day_data, start_date, end_date, seasons, weather_conditions)
+
+
+@flow.node('hourly_cube', 'start_date', 'end_date', 'seasons', 'weather_conditions')
+def hours(hourly_cube, start_date, end_date, seasons, weather_conditions):
+    return filter_hours(hourly_cube, start_date, end_date, seasons, weather_conditions)
+
+
+@flow.node('days')
+def monthly(days):
+    if days.empty:
+        return None
+    # Mengelompokkan berdasarkan bulan, musim, dan cuaca
+    monthly_data = days.groupby([days.index.to_period('M'), 'season', 'weathersit'], observed=True)['cnt'].sum().reset_index()
+    monthly_data.columns = ['Month', 'Season', 'Weather', 'Total Peminjaman']
+
+    # Mengubah 'Month' menjadi string agar seaborn bisa memprosesnya dengan baik
+    monthly_data['Month'] = monthly_data['Month'].astype(str)
+    return monthly_data
+
+
+@flow.node('days')
+def scatter(days):
+    if days.empty:
+        return None
+    # Di atas ambang jumlah titik, scatter diganti grid rata-rata atau sampel berstrata
+    return scatter_view(days[['temp', 'hum', 'weathersit', 'season', 'cnt']])
+
+
+@flow.node('hours')
+def hourly_holiday(hours):
+    # Mengelompokkan data berdasarkan jam dan hari libur (dari cube agregat, bukan baris mentah)
+    hourly_data_holiday = hourly_totals(hours, 'holiday')
+
+    # Memisahkan data untuk hari kerja dan hari libur
+    data_working_day = hourly_data_holiday[hourly_data_holiday['holiday'] == 0]
+    data_holiday = hourly_data_holiday[hourly_data_holiday['holiday'] == 1]
+    return data_working_day, data_holiday
+
+
+@flow.node('hours')
+def hourly_weather(hours):
+    # Mengelompokkan data berdasarkan jam dan kondisi cuaca (dari cube agregat)
+    return drop_unused_labels(hourly_totals(hours, 'weathersit'))
+
+
+@flow.node('day_data')
+def rfm_edges(day_data):
+    # Batas kuantil Frequency/Monetary dari seluruh data, tidak bergantung pada filter
+    return reference_edges(day_data, config.RFM_BINS)
+
+
+@flow.node('days', 'rfm_edges')
+def rfm(days, edges):
+    if days.empty:
+        return None
+    # Recency: hari sejak peminjaman terakhir; Frequency dan Monetary: total peminjaman per hari.
+    # Metrik dan skor dihitung ke frame baru, bukan ditambahkan ke frame hasil filter
+    return rfm_scores(days, config.RFM_BINS, edges=edges)
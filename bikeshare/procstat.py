@@ -0,0 +1,42 @@
+"""Pembacaan memori proses dari /proc (Linux) untuk benchmark dan soak test."""
+import ctypes
+import os
+
+
+def rss_mb():
+    """RSS proses saat ini."""
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def peak_rss_mb():
+    """Puncak RSS proses (VmHWM). ru_maxrss tidak dipakai karena diwarisi dari proses induk."""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def reset_peak_rss():
+    """Mengatur ulang puncak RSS (VmHWM) ke RSS saat ini; False jika kernel tidak mengizinkan."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def trim_heap():
+    """Mengembalikan memori bebas milik alokator glibc ke OS (``malloc_trim``); False jika tidak tersedia.
+
+    Tanpa ini RSS ikut memuat sisa heap yang sudah dibebaskan tapi belum
+    dikembalikan, yang naik-turun puluhan MB tergantung urutan alokasi.
+    """
+    try:
+        libc = ctypes.CDLL('libc.so.6')
+        return bool(libc.malloc_trim(0))
+    except (OSError, AttributeError):
+        return False
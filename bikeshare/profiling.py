@@ -0,0 +1,125 @@
+"""Instrumentasi satu rerun dashboard: waktu per tahap/bagian, log terstruktur, dan profil cProfile.
+
+``RerunProfile`` dibuat di awal skrip dan diselesaikan di akhir. Di antaranya
+kode mana pun bisa mencatat tahap dengan ``with stage('nama'):`` tanpa harus
+menerima objek profil sebagai argumen (profil aktif disimpan di context
+variable, jadi sesi-sesi yang berjalan paralel tidak saling tercampur). Tahap
+boleh bersarang: waktu ``section:monthly`` sudah termasuk ``chart:monthly_chart``.
+
+Saat selesai, satu record JSON per rerun ditulis ke logger ``bikeshare.profiling``
+dan (jika ``BIKESHARE_TIMING_LOG`` diisi) ditambahkan ke file JSON Lines.
+Jika diminta, seluruh rerun diprofilkan dengan cProfile dan hasilnya disimpan
+sebagai file ``.prof`` (bisa dibuka dengan ``python -m pstats`` atau snakeviz).
+"""
+import contextvars
+import cProfile
+import io
+import itertools
+import json
+import logging
+import os
+import pstats
+import time
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+# depth: tingkat sarang (0 = tahap teratas)
+Stage = namedtuple('Stage', ['stage', 'depth', 'seconds'])
+
+_current = contextvars.ContextVar('bikeshare_rerun_profile', default=None)
+
+_profile_numbers = itertools.count(1)
+
+
+class RerunProfile:
+    """Catatan waktu satu rerun; `profile=True` juga menjalankan cProfile selama rerun."""
+
+    def __init__(self, session=None, profile=False):
+        self.session = session
+        self.started_at = time.time()
+        self.stages = []
+        self.nodes = []
+        self.seconds = None
+        self.profiler = cProfile.Profile() if profile else None
+        self.profile_path = None
+        self._depth = 0
+        self._start = None
+        self._token = None
+
+    def start(self):
+        self._token = _current.set(self)
+        self._start = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    @contextmanager
+    def stage(self, name):
+        index = len(self.stages)
+        self.stages.append(None)  # posisi dicadangkan agar urutan mengikuti urutan mulai tahap
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.stages[index] = Stage(name, self._depth, time.perf_counter() - start)
+
+    def finish(self, run=None, profile_dir='profiles', log_path=''):
+        """Menghentikan pencatatan, menyimpan profil (jika ada), dan menulis record log."""
+        # Profiler dan context variable dilepas lebih dulu, jadi tetap bersih walau menulis file gagal
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.seconds = time.perf_counter() - self._start
+        if run is not None:
+            self.nodes = list(run.events)
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+        if self.profiler is not None:
+            os.makedirs(profile_dir, exist_ok=True)
+            stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+            # Nomor urut per proses: beberapa sesi dalam satu proses bisa selesai pada detik yang sama
+            self.profile_path = os.path.join(profile_dir, f'rerun-{stamp}-{os.getpid()}-{next(_profile_numbers)}.prof')
+            self.profiler.dump_stats(self.profile_path)
+
+        line = json.dumps(self.record())
+        logger.info(line)
+        if log_path:
+            with open(log_path, 'a') as f:
+                f.write(line + '\n')
+        return self
+
+    def record(self):
+        """Record terstruktur rerun ini (untuk log JSON)."""
+        return {
+            'ts': round(self.started_at, 3),
+            'session': self.session,
+            'pid': os.getpid(),
+            'seconds': round(self.seconds, 6) if self.seconds is not None else None,
+            'stages': [{'stage': s.stage, 'depth': s.depth, 'seconds': round(s.seconds, 6)} for s in self.stages if s],
+            'nodes': [{'node': e.node, 'status': e.status, 'seconds': round(e.seconds, 6)} for e in self.nodes],
+            'profile': self.profile_path,
+        }
+
+    def top_functions(self, limit=25, sort='cumulative'):
+        """Ringkasan teks profil cProfile (fungsi teratas), atau None jika rerun ini tidak diprofilkan."""
+        if self.profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+def current():
+    """Profil rerun yang sedang berjalan di konteks ini, atau None."""
+    return _current.get()
+
+
+def stage(name):
+    """Mencatat waktu blok `with` sebagai tahap rerun aktif; tanpa efek jika tidak ada rerun yang dicatat."""
+    profile = _current.get()
+    return profile.stage(name) if profile is not None else nullcontext()
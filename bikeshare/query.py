@@ -0,0 +1,214 @@
+"""Jalur query terindeks untuk filter dashboard.
+
+``IndexedFrame`` membungkus frame yang terurut berdasarkan ``DatetimeIndex``
+tanggal. Filter rentang tanggal menjadi pencarian biner (``searchsorted``)
+yang mengembalikan potongan baris (view, tanpa menyalin data) dan filter
+musim/cuaca memakai kode kategori kolom itu sendiri: label terpilih menjadi
+tabel lookup kecil yang diindeks dengan kode baris dalam rentang tanggal,
+bukan perbandingan ``isin`` antar string. Tidak ada struktur per label yang
+disimpan di samping frame, jadi frame yang di-memory-map bersama (lihat
+``bikeshare.shared``) tidak diduplikasi di setiap proses worker.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# Penanda unik per IndexedFrame, dipakai sebagai bagian kunci cache hasil filter
+_tokens = itertools.count()
+
+
+def new_token():
+    """Penanda unik baru untuk objek data yang dipakai sebagai kunci cache."""
+    return next(_tokens)
+
+
+def date_bounds(index, start, end):
+    """Posisi [lo, hi) baris dengan start <= tanggal <= end pada index yang terurut."""
+    lo = index.searchsorted(pd.Timestamp(start), side='left')
+    hi = index.searchsorted(pd.Timestamp(end), side='right')
+    return lo, max(lo, hi)
+
+
+def present_labels(frame, columns):
+    """kolom -> frozenset label yang muncul di `frame` (satu ``bincount`` atas kode kategori per kolom)."""
+    labels = {}
+    for col in columns:
+        if col not in frame.columns:
+            continue
+        values = frame[col].array
+        codes = np.asarray(values.codes)
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.categories))
+        labels[col] = frozenset(values.categories[counts > 0])
+    return labels
+
+
+def _join(pieces, empty):
+    """Satu frame dari potongan berurutan: view jika hanya satu potongan, selain itu disalin sekali."""
+    if not pieces:
+        return empty.iloc[:0]
+    return pieces[0] if len(pieces) == 1 else pd.concat(pieces)
+
+
+class IndexedFrame:
+    """Frame terurut per tanggal; filter label memakai kode kategori kolom `label_columns`.
+
+    Barisnya disimpan sebagai beberapa potongan terurut yang tidak pernah
+    diubah (lihat ``with_tail``). Frame yang dibangun sekaligus hanya punya
+    satu potongan.
+    """
+
+    def __init__(self, frame, label_columns=('season', 'weathersit'), labels=None):
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index(kind='stable')
+            labels = None
+        self._init([frame], label_columns, present_labels(frame, label_columns) if labels is None else labels)
+
+    def _init(self, chunks, label_columns, labels):
+        # Potongan kosong dibuang, kecuali satu untuk kolom dan dtype frame kosong
+        self.chunks = [chunk for chunk in chunks if len(chunk)] or chunks[-1:]
+        self.label_columns = label_columns
+        self.token = new_token()
+        # Hanya himpunan label yang muncul yang disimpan (beberapa string per kolom), bukan mask per label
+        self.labels = labels
+
+    def with_tail(self, tail):
+        """IndexedFrame baru: baris mulai tanggal pertama `tail` diganti dengan `tail`.
+
+        Potongan yang seluruhnya sebelum `tail` dipakai ulang apa adanya, jadi
+        biayanya sebanding dengan ukuran `tail`, bukan ukuran frame. Potongan
+        terakhir digabung selama ukurannya tidak lebih kecil dari potongan
+        sesudahnya, sehingga jumlah potongan tetap O(log n) dan setiap baris
+        disalin O(log n) kali sepanjang umur feed. `tail` harus terurut per tanggal.
+        """
+        if tail.empty:
+            return self
+        start = tail.index[0]
+        chunks = []
+        for chunk in self.chunks:
+            lo = chunk.index.searchsorted(start, side='left')
+            if lo < len(chunk):
+                chunks.append(chunk.iloc[:lo])
+                break
+            chunks.append(chunk)
+        chunks = [chunk for chunk in chunks if len(chunk)] + [tail]
+        while len(chunks) > 1 and len(chunks[-2]) <= len(chunks[-1]):
+            chunks[-2:] = [pd.concat(chunks[-2:])]
+        # Label bagian awal bisa saja tidak muncul lagi setelah dipotong; himpunan yang lebih besar
+        # hanya membuat filter membangun mask yang semuanya True, hasilnya tetap benar
+        tail_labels = present_labels(tail, self.label_columns)
+        labels = {col: present | tail_labels.get(col, frozenset()) for col, present in self.labels.items()}
+        frame = IndexedFrame.__new__(IndexedFrame)
+        frame._init(chunks, self.label_columns, labels)
+        return frame
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    @property
+    def min_date(self):
+        return self.chunks[0].index[0]
+
+    @property
+    def max_date(self):
+        return self.chunks[-1].index[-1]
+
+    def position(self, date):
+        """Jumlah baris dengan tanggal sebelum `date`."""
+        rows = 0
+        for chunk in self.chunks:
+            lo = chunk.index.searchsorted(pd.Timestamp(date), side='left')
+            rows += lo
+            if lo < len(chunk):
+                break
+        return rows
+
+    def _ranges(self, start, end):
+        """(potongan, lo, hi) untuk setiap potongan yang punya baris dengan start <= tanggal <= end."""
+        for chunk in self.chunks:
+            lo, hi = date_bounds(chunk.index, start, end)
+            if hi > lo:
+                yield chunk, lo, hi
+
+    def filter_range(self, start, end):
+        """Baris dengan start <= tanggal <= end, O(log n).
+
+        Rentang dalam satu potongan dikembalikan sebagai view dari frame
+        bersama (tanpa menyalin data): jangan diubah in-place.
+        """
+        return _join([chunk.iloc[lo:hi] for chunk, lo, hi in self._ranges(start, end)], self.chunks[0])
+
+    def _lookup(self, col, labels):
+        """Tabel lookup kode kategori -> terpilih untuk label `labels`, atau None jika tidak perlu disaring."""
+        present = self.labels[col]
+        labels = [label for label in labels if label in present]
+        if len(labels) == len(present):
+            return None
+        categories = self.chunks[0][col].cat.categories
+        # Kode -1 (NaN) jatuh ke slot terakhir, yang selalu False
+        lookup = np.zeros(len(categories) + 1, dtype=bool)
+        lookup[categories.get_indexer(labels)] = True
+        return lookup
+
+    def select(self, start, end, **selections):
+        """Baris dengan start <= tanggal <= end dan label kolom di `selections` (mis. season=[...])."""
+        lookups = {col: self._lookup(col, labels) for col, labels in selections.items()}
+        lookups = {col: lookup for col, lookup in lookups.items() if lookup is not None}
+        pieces = []
+        for chunk, lo, hi in self._ranges(start, end):
+            rows = chunk.iloc[lo:hi]
+            mask = None
+            for col, lookup in lookups.items():
+                col_mask = lookup[np.asarray(chunk[col].array.codes[lo:hi])]
+                mask = col_mask if mask is None else mask & col_mask
+            pieces.append(rows if mask is None else rows[mask])
+        return _join(pieces, self.chunks[0])
+
+
+def sort_keys(values, ascending=True):
+    """Kunci numerik untuk mengurutkan `values` (Series/Index); NaN selalu di akhir."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        keys = np.asarray(values.array.codes, dtype='float64')
+        keys[keys < 0] = np.nan
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        keys = np.asarray(values.view('int64') if isinstance(values, pd.Index) else values.astype('int64'), dtype='float64')
+        keys[np.asarray(values.isna())] = np.nan
+    elif pd.api.types.is_numeric_dtype(values):
+        keys = np.asarray(values, dtype='float64')
+    else:
+        codes, _ = pd.factorize(values, sort=True)
+        keys = codes.astype('float64')
+        keys[codes < 0] = np.nan
+    if not ascending:
+        keys = -keys
+    return np.where(np.isnan(keys), np.inf, keys)
+
+
+def sorted_positions(keys, stop):
+    """Posisi `stop` baris pertama menurut `keys` (stabil: seri diurutkan menurut posisi).
+
+    Hanya baris yang dibutuhkan yang diurutkan penuh, jadi biayanya O(n + k log k),
+    bukan O(n log n) untuk seluruh frame.
+    """
+    stop = min(stop, len(keys))
+    if stop == 0:
+        return np.empty(0, dtype='int64')
+    kth = np.partition(keys, stop - 1)[stop - 1]
+    less = np.flatnonzero(keys < kth)
+    equal = np.flatnonzero(keys == kth)[:stop - len(less)]
+    candidates = np.concatenate([less, equal])
+    return candidates[np.lexsort((candidates, keys[candidates]))]
+
+
+def table_page(frame, columns, sort_by, ascending, start, stop):
+    """Baris [start, stop) dari `frame` setelah diurutkan, hanya untuk `columns`.
+
+    `sort_by` boleh nama kolom, nama index, atau None (urutan asli). Kolom dan
+    baris dipilih sebelum data disalin, jadi yang tersalin hanya isi halaman.
+    """
+    col_positions = [frame.columns.get_loc(col) for col in columns]
+    if sort_by is None:
+        return frame.iloc[start:stop, col_positions]
+    values = frame.index if sort_by == frame.index.name else frame[sort_by]
+    positions = sorted_positions(sort_keys(values, ascending), stop)[start:]
+    return frame.iloc[positions, col_positions]
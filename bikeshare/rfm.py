@@ -0,0 +1,74 @@
+"""Analisis RFM (Recency, Frequency, Monetary) per hari, sekali jalan dan tervektorisasi.
+
+Metrik dan skor dihitung ke frame baru yang ringkas (frame hasil filter
+tidak diubah). Skor diberikan dengan ``np.searchsorted`` terhadap batas
+kuantil, bukan ``pd.qcut``: batas yang kembar (banyak nilai sama) hanya
+membuat kelas kosong, tidak menimbulkan error.
+
+Batas kuantil Frequency/Monetary bisa diambil dari seluruh data
+(``reference_edges``; node ``rfm_edges`` di ``bikeshare.pipeline`` menyimpannya
+di cache dataflow per data) sehingga perubahan filter kecil tidak perlu
+menghitung kuantil lagi. Recency dihitung relatif terhadap
+tanggal terakhir pada data terfilter, jadi batasnya selalu dari data itu.
+"""
+import numpy as np
+import pandas as pd
+
+
+METRICS = ['Recency', 'Frequency', 'Monetary']
+
+# Metrik yang distribusinya tidak bergantung pada rentang tanggal yang dipilih
+REFERENCE_METRICS = ['Frequency', 'Monetary']
+
+
+def score_labels(metric, bins):
+    """Label skor dari kelas terendah ke tertinggi; Recency kecil berarti skor tinggi."""
+    labels = ['Low', 'Medium', 'High'] if bins == 3 else [str(i) for i in range(1, bins + 1)]
+    return labels[::-1] if metric == 'Recency' else labels
+
+
+def rfm_metrics(frame):
+    """Recency (hari sejak tanggal terakhir), Frequency dan Monetary (cnt) per baris `frame`."""
+    dates = frame.index
+    cnt = frame['cnt'].to_numpy()
+    return pd.DataFrame({
+        'dteday': dates,
+        'Recency': ((dates.max() - dates).days).astype('int32'),
+        'Frequency': cnt,
+        'Monetary': cnt,
+    })
+
+
+def quantile_edges(metrics, bins, columns=METRICS):
+    """Batas kuantil (`bins` + 1 nilai) per kolom, dihitung sekaligus untuk semua kolom."""
+    values = metrics[columns].to_numpy(dtype='float64')
+    edges = np.quantile(values, np.linspace(0, 1, bins + 1), axis=0)
+    return {column: edges[:, i] for i, column in enumerate(columns)}
+
+
+def reference_edges(day_data, bins):
+    """Batas kuantil Frequency/Monetary dari seluruh `day_data` (``IndexedFrame`` atau tabel store)."""
+    return quantile_edges(
+        rfm_metrics(day_data.filter_range(day_data.min_date, day_data.max_date)), bins, REFERENCE_METRICS,
+    )
+
+
+def rfm_scores(frame, bins=3, edges=None):
+    """Frame RFM: metrik plus skor kategorikal per metrik.
+
+    `edges` (dict metrik -> batas kuantil) dipakai jika ada; metrik lain
+    memakai kuantil dari `frame` sendiri.
+    """
+    rfm = rfm_metrics(frame)
+    edges = dict(edges or {})
+    missing = [metric for metric in METRICS if metric not in edges]
+    if missing:
+        edges.update(quantile_edges(rfm, bins, missing))
+
+    for metric in METRICS:
+        # Seperti qcut, kelas tertutup di kanan: nilai sama dengan batas masuk kelas bawah.
+        # Nilai di luar batas (batas dari data lain) masuk kelas pertama/terakhir.
+        codes = np.searchsorted(edges[metric][1:-1], rfm[metric].to_numpy(), side='left')
+        dtype = pd.CategoricalDtype(score_labels(metric, bins), ordered=True)
+        rfm[f'{metric}_Score'] = pd.Categorical.from_codes(codes, dtype=dtype)
+    return rfm
@@ -0,0 +1,78 @@
+"""Reduksi data untuk scatter suhu/kelembaban pada data yang besar.
+
+Di atas ambang jumlah titik (``BIKESHARE_SCATTER_MAX_POINTS``) scatter satu
+titik per baris diganti dengan salah satu dari:
+
+* ``bins``: grid suhu x kelembaban berisi rata-rata ``cnt`` per sel
+  (dihitung dengan ``np.bincount``, tanpa groupby), atau
+* ``sample``: sampel berstrata per kombinasi cuaca x musim, proporsional
+  terhadap ukuran strata, sehingga strata kecil tetap terwakili.
+"""
+import numpy as np
+import pandas as pd
+
+from bikeshare import config
+
+REDUCTIONS = ('bins', 'sample')
+
+
+def _edges(values, bins):
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if lo == hi:
+        hi = lo + 1e-6
+    return np.linspace(lo, hi, bins + 1)
+
+
+def bin_mean(frame, x='temp', y='hum', value='cnt', bins=30):
+    """Rata-rata `value` per sel grid `x` x `y`; hanya sel yang berisi data yang dikembalikan."""
+    xs = frame[x].to_numpy(dtype='float64')
+    ys = frame[y].to_numpy(dtype='float64')
+    values = frame[value].to_numpy(dtype='float64')
+    x_edges, y_edges = _edges(xs, bins), _edges(ys, bins)
+
+    # Nilai maksimum masuk ke sel terakhir, bukan sel di luar grid
+    ix = np.clip(np.searchsorted(x_edges, xs, side='right') - 1, 0, bins - 1)
+    iy = np.clip(np.searchsorted(y_edges, ys, side='right') - 1, 0, bins - 1)
+    cell = ix * bins + iy
+
+    counts = np.bincount(cell, minlength=bins * bins)
+    sums = np.bincount(cell, weights=values, minlength=bins * bins)
+    filled = np.flatnonzero(counts)
+    cx, cy = np.divmod(filled, bins)
+    return pd.DataFrame({
+        f'{x}_lo': x_edges[cx], f'{x}_hi': x_edges[cx + 1],
+        f'{y}_lo': y_edges[cy], f'{y}_hi': y_edges[cy + 1],
+        value: sums[filled] / counts[filled],
+        'n': counts[filled],
+    })
+
+
+def stratified_sample(frame, n, by=('weathersit', 'season'), seed=0):
+    """Sampel ~`n` baris, proporsional per strata `by` (minimal satu baris per strata)."""
+    if len(frame) <= n:
+        return frame
+    strata = frame.groupby(list(by), observed=True, sort=False).ngroup().to_numpy()
+    sizes = np.bincount(strata)
+    quota = np.maximum(1, np.floor(sizes * n / len(frame))).astype('int64')
+
+    # Urutkan acak di dalam setiap strata, lalu ambil `quota` baris pertama tiap strata
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(len(frame)), strata))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(frame)) - starts[strata[order]]
+    keep = np.sort(order[rank < quota[strata[order]]])
+    return frame.iloc[keep]
+
+
+def scatter_view(frame, max_points=None, reduction=None):
+    """Nama grafik dan data untuk bagian scatter, plus keterangan jika data direduksi."""
+    max_points = config.SCATTER_MAX_POINTS if max_points is None else max_points
+    reduction = reduction or config.SCATTER_REDUCTION
+    if len(frame) <= max_points:
+        return 'temp_hum_scatter', frame, None
+    if reduction == 'sample':
+        sample = stratified_sample(frame, max_points)
+        return 'temp_hum_scatter', sample, f'Menampilkan sampel berstrata {len(sample)} dari {len(frame)} titik.'
+    if reduction == 'bins':
+        return 'temp_hum_density', bin_mean(frame), f'{len(frame)} titik diringkas menjadi rata-rata per sel suhu x kelembaban.'
+    raise ValueError(f'Reduksi scatter tidak dikenal: {reduction!r} (pilihan: {", ".join(REDUCTIONS)})')
@@ -0,0 +1,71 @@
+"""Skema dtype ringkas untuk day.csv dan hour.csv.
+
+Kolom kode dibaca langsung sebagai int8, hitungan sebagai int16/int32,
+ukuran cuaca sebagai float32, dan ``dteday`` di-parse saat membaca. Kode
+musim dan cuaca lalu diubah menjadi kategori berlabel (1 byte per baris).
+"""
+import numpy as np
+import pandas as pd
+
+# Label mengikuti urutan kode 1, 2, 3, ... di dataset
+SEASON_LABELS = ['Musim Semi', 'Musim Panas', 'Musim Gugur', 'Musim Dingin']
+WEATHER_LABELS = ['Cuaca Cerah', 'Cuaca Berawan', 'Cuaca Buruk', 'Cuaca Sangat Buruk']
+
+SEASON_DTYPE = pd.CategoricalDtype(SEASON_LABELS)
+WEATHER_DTYPE = pd.CategoricalDtype(WEATHER_LABELS)
+
+# Kolom kode -> tipe kategori berlabel
+LABEL_COLUMNS = {'season': SEASON_DTYPE, 'weathersit': WEATHER_DTYPE}
+
+DATE_COLUMNS = ['dteday']
+
+_COMMON_DTYPES = {
+    'instant': 'int32',
+    'season': 'int8',
+    'yr': 'int8',
+    'mnth': 'int8',
+    'holiday': 'int8',
+    'weekday': 'int8',
+    'workingday': 'int8',
+    'weathersit': 'int8',
+    'temp': 'float32',
+    'atemp': 'float32',
+    'hum': 'float32',
+    'windspeed': 'float32',
+}
+
+# Hitungan per jam per lokasi muat di int16
+HOUR_DTYPES = {**_COMMON_DTYPES, 'hr': 'int8', 'casual': 'int16', 'registered': 'int16', 'cnt': 'int16'}
+
+# Total harian bisa melewati 32767 bila beberapa kota digabung, jadi int32
+DAY_DTYPES = {**_COMMON_DTYPES, 'casual': 'int32', 'registered': 'int32', 'cnt': 'int32'}
+
+
+def codes_to_labels(codes, dtype):
+    """Kode 1..n menjadi kategori berlabel; kode di luar rentang menjadi NaN."""
+    codes = np.asarray(codes)
+    n = len(dtype.categories)
+    valid = (codes >= 1) & (codes <= n)
+    return pd.Categorical.from_codes(np.where(valid, codes - 1, -1).astype('int8'), dtype=dtype)
+
+
+def apply_labels(frame):
+    for col, dtype in LABEL_COLUMNS.items():
+        if col in frame.columns:
+            frame[col] = codes_to_labels(frame[col], dtype)
+    return frame
+
+
+def read_csv(path, dtypes, **kwargs):
+    """``pd.read_csv`` dengan dtype dari skema dan ``dteday`` langsung di-parse."""
+    return pd.read_csv(path, dtype=dtypes, parse_dates=DATE_COLUMNS, **kwargs)
+
+
+def drop_unused_labels(frame):
+    """Membuang kategori label yang tidak muncul di frame (agar legenda grafik tidak berisi label kosong)."""
+    columns = {
+        col: frame[col].cat.remove_unused_categories()
+        for col in frame.columns
+        if isinstance(frame[col].dtype, pd.CategoricalDtype)
+    }
+    return frame.assign(**columns) if columns else frame
@@ -0,0 +1,31 @@
+"""Bagian-bagian dashboard yang dihitung hanya saat dibuka.
+
+Setiap ``Section`` menyatakan node dataflow yang ditampilkannya (lihat
+``bikeshare.pipeline``). Bagian yang tidak dipilih pengguna tidak
+mengevaluasi node-nya sama sekali; bagian yang dibuka mengambil node-nya dari
+cache dataflow jika input node itu tidak berubah sejak rerun sebelumnya.
+"""
+from collections import namedtuple
+
+import streamlit as st
+
+from bikeshare.profiling import stage
+
+# key: id bagian; label: nama singkat di pemilih bagian; node: node dataflow yang ditampilkan;
+# render(data) menampilkan nilai node (dipanggil setiap rerun)
+Section = namedtuple('Section', ['key', 'label', 'title', 'node', 'render'])
+
+
+def show_sections(sections, run, default=None, key='sections'):
+    """Pemilih bagian lalu hanya bagian yang dipilih yang dievaluasi (lewat `run`) dan ditampilkan."""
+    labels = {section.key: section.label for section in sections}
+    selected = st.segmented_control(
+        'Tampilkan bagian', list(labels), selection_mode='multi',
+        default=default if default is not None else [sections[0].key],
+        format_func=labels.get, key=key,
+    )
+    for section in sections:
+        if section.key in (selected or []):
+            with stage(f'section:{section.key}'):
+                st.subheader(section.title)
+                section.render(run.get(section.node))
@@ -0,0 +1,71 @@
+"""Frame yang dibagikan antar proses worker lewat file Arrow IPC yang di-memory-map.
+
+Dengan beberapa proses Streamlit di belakang load balancer, setiap proses
+biasanya mem-parsing dan menyimpan salinan datanya sendiri. Di mode ini frame
+yang sudah disiapkan (frame harian dan cube per jam) ditulis sekali sebagai
+file Arrow IPC tanpa kompresi di folder bersama (sebaiknya tmpfs, misalnya
+``/dev/shm/bikeshare``). Proses lain cukup me-memory-map file itu: kolom
+numerik, tanggal, dan kode kategori langsung menunjuk ke halaman file yang
+sama (zero-copy), jadi RAM tidak bertambah per worker.
+
+Nama file memuat fingerprint sumber; proses yang pertama menemukan file belum
+ada akan membangunnya (tulis ke file sementara lalu rename, aman bila beberapa
+proses membangun bersamaan). Frame hasil memory map bersifat read-only.
+"""
+import glob
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow opsional, tanpa pyarrow setiap proses membangun frame sendiri
+    pa = None
+
+
+def shared_path(directory, name, fingerprint):
+    return os.path.join(directory, f'{name}-{fingerprint}.arrow')
+
+
+def write_shared(frame, path):
+    """Menulis frame (beserta index) sebagai Arrow IPC tanpa kompresi, secara atomik."""
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def attach(path):
+    """Frame pandas yang kolomnya menunjuk langsung ke file `path` yang di-memory-map."""
+    table = ipc.open_file(pa.memory_map(path)).read_all()
+    # Satu block per kolom: pandas tidak menggabungkan (dan menyalin) kolom-kolomnya
+    return table.to_pandas(split_blocks=True)
+
+
+def _remove_stale(directory, name, keep):
+    for path in glob.glob(os.path.join(directory, f'{name}-*.arrow')):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_shared(directory, name, fingerprint, build):
+    """Frame `name` untuk versi data `fingerprint` dari folder bersama; dibangun dengan `build()` jika belum ada."""
+    if pa is None:
+        return build()
+    path = shared_path(directory, name, fingerprint)
+    if not os.path.exists(path):
+        frame = build()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            write_shared(frame, path)
+        except OSError:
+            # Folder bersama tidak bisa ditulis: proses ini memakai salinannya sendiri
+            return frame
+        # File versi lama tidak dipakai lagi (proses yang masih memetakannya tetap aman)
+        _remove_stale(directory, name, path)
+    return attach(path)
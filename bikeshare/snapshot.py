@@ -0,0 +1,93 @@
+"""Snapshot kolumnar (Feather/Arrow IPC) untuk hour.csv (dan CSV lain dengan skema yang sama).
+
+Snapshot menyimpan frame yang sudah disiapkan lengkap dengan tipe datanya
+(lihat ``bikeshare.schema``: tanggal datetime64, label kategorikal, hitungan
+int kecil) sehingga loader tidak perlu mem-parsing teks dan menebak dtype
+lagi. Snapshot dianggap segar jika fingerprint CSV sumber dan versi formatnya
+sama dengan metadata snapshot.
+
+Membangun snapshot secara manual::
+
+    python -m bikeshare.snapshot
+"""
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow opsional, loader kembali ke CSV
+    pa = None
+
+# Naikkan jika cara menyiapkan frame berubah agar snapshot lama dibangun ulang
+SNAPSHOT_VERSION = '2'
+
+
+def snapshot_path(csv_path):
+    """Lokasi snapshot untuk sebuah CSV: data/snapshot/<nama>.feather."""
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(os.path.dirname(csv_path), 'snapshot', name + '.feather')
+
+
+def _metadata(fingerprint):
+    return {b'source_fingerprint': fingerprint.encode(), b'snapshot_version': SNAPSHOT_VERSION.encode()}
+
+
+def is_fresh(csv_path, fingerprint):
+    """True jika snapshot ada dan dibuat dari isi CSV yang sama."""
+    path = snapshot_path(csv_path)
+    if pa is None or not os.path.exists(path):
+        return False
+    try:
+        # Hanya membaca skema (footer file), bukan datanya
+        metadata = ipc.open_file(path).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    expected = _metadata(fingerprint)
+    return all(metadata.get(key) == value for key, value in expected.items())
+
+
+def write_snapshot(frame, csv_path, fingerprint):
+    """Menulis frame ke snapshot secara atomik (tulis ke file sementara lalu rename)."""
+    path = snapshot_path(csv_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_metadata(fingerprint)})
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    feather.write_feather(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot(csv_path):
+    return feather.read_table(snapshot_path(csv_path)).to_pandas()
+
+
+def load_frame(csv_path, fingerprint, read_csv):
+    """Memuat frame dari snapshot jika segar; jika tidak, lewat `read_csv` lalu snapshot diperbarui."""
+    if is_fresh(csv_path, fingerprint):
+        return read_snapshot(csv_path)
+
+    frame = read_csv(csv_path)
+    if pa is not None:
+        try:
+            write_snapshot(frame, csv_path, fingerprint)
+        except OSError:
+            # Folder data bisa saja read-only di server; CSV tetap bisa dipakai
+            pass
+    return frame
+
+
+def main():
+    from bikeshare.loader import HOUR_CSV, file_fingerprint, read_hour_csv
+
+    if pa is None:
+        raise SystemExit('pyarrow belum terpasang: pip install pyarrow')
+    # Data harian diturunkan dari hour.csv, jadi hanya hour.csv yang perlu snapshot
+    fingerprint = file_fingerprint(HOUR_CSV)
+    frame = read_hour_csv(HOUR_CSV)
+    print(f'{HOUR_CSV} -> {write_snapshot(frame, HOUR_CSV, fingerprint)} ({len(frame)} baris)')
+
+
+if __name__ == '__main__':
+    main()
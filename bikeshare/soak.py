@@ -0,0 +1,146 @@
+"""Soak test: ribuan rerun dashboard.py untuk memastikan memori tidak terus naik.
+
+Dashboard dijalankan headless dengan ``streamlit.testing.v1.AppTest``. Setiap
+rerun memakai salah satu kombinasi filter acak dari kumpulan kecil (agar cache
+bisa terisi penuh), dan cache gambar dikosongkan berkala supaya grafik
+benar-benar dirender ulang. Selama soak batas cache gambar diperkecil
+(``--figure-cache-mb``) agar isi cache yang dibuang dan diisi ulang tidak
+ikut terbaca sebagai kenaikan RSS.
+
+RSS satu titik bisa naik-turun puluhan MB antar rerun (sisa heap alokator,
+cache yang baru dikosongkan), jadi yang diuji adalah trennya: setelah
+pemanasan RSS diambil setiap ``--sample-every`` rerun (setelah
+``gc.collect`` dan ``malloc_trim``), lalu median seperempat sampel terakhir
+dibandingkan dengan median seperempat sampel pertama. Kenaikan itu tidak
+boleh melebihi ``--max-growth-mb``; median tidak terpengaruh lonjakan sesaat,
+sedangkan kebocoran menggeser seluruh jendela terakhir. Kemiringan regresi
+linear (MB per 1000 rerun) ikut dilaporkan. Soak juga gagal jika ada
+rerun yang berakhir dengan error atau figure yang tertinggal di registry
+pyplot.
+
+Contoh::
+
+    python -m bikeshare.soak --reruns 2000
+"""
+import argparse
+import datetime
+import gc
+import os
+import random
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from bikeshare import schema
+from bikeshare.figures import figure_cache
+from bikeshare.procstat import rss_mb, trim_heap
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dashboard.py')
+
+
+# Kunci semua bagian dashboard (lihat show_sections di dashboard.py); semuanya dibuka agar ikut dirender
+SECTION_KEYS = ['data', 'monthly', 'scatter', 'hourly_holiday', 'hourly_weather', 'rfm']
+
+# Batas kenaikan median RSS (MB). Pada tree yang bersih selisihnya di bawah +20 MB (700 dan 2000 rerun)
+# meskipun sampel tunggal naik-turun 40 MB; kebocoran 200 KB per rerun sudah gagal dalam 600 rerun
+MAX_GROWTH_MB = 30
+
+
+def random_filters(rng, min_date, max_date):
+    """Satu kombinasi filter acak: (tanggal mulai, tanggal selesai, musim, cuaca)."""
+    start = min_date + datetime.timedelta(days=rng.randrange((max_date - min_date).days))
+    end = min(max_date, start + datetime.timedelta(days=rng.choice([30, 90, 365, 730])))
+    seasons = rng.sample(schema.SEASON_LABELS, rng.randint(1, len(schema.SEASON_LABELS)))
+    weather = rng.sample(schema.WEATHER_LABELS, rng.randint(1, len(schema.WEATHER_LABELS)))
+    return start, end, seasons, weather
+
+
+def set_filters(at, filters):
+    """Mengubah widget filter seperti yang dilakukan pengguna."""
+    start, end, seasons, weather = filters
+    at.date_input(key='start_date').set_value(start)
+    at.date_input(key='end_date').set_value(end)
+    at.multiselect(key='seasons').set_value(seasons)
+    at.multiselect(key='weather_conditions').set_value(weather)
+
+
+def run(reruns, combos, render_every, warmup, sample_every, seed, figure_cache_mb):
+    """Menjalankan soak; mengembalikan (sampel (rerun, RSS) setelah pemanasan, jumlah error, pesan error pertama)."""
+    rng = random.Random(seed)
+    figure_cache.max_bytes = int(figure_cache_mb * 2**20)
+    at = AppTest.from_file(DASHBOARD, default_timeout=120)
+    at.session_state['sections'] = SECTION_KEYS
+    at.run()
+    if at.exception:
+        # Dashboard sudah gagal di rerun pertama: tidak ada yang bisa diukur
+        return [], 1, at.exception[0].message
+    min_date, max_date = at.date_input(key='start_date').min, at.date_input(key='start_date').max
+    pool = [random_filters(rng, min_date, max_date) for _ in range(combos)]
+
+    samples = []
+    errors, first_error = 0, None
+    for i in range(1, reruns + 1):
+        if i % render_every == 0:
+            figure_cache.clear()
+        set_filters(at, rng.choice(pool))
+        at.run()
+        if at.exception:
+            # Error tidak menghentikan soak, tapi membuatnya gagal di akhir
+            errors += 1
+            first_error = first_error or at.exception[0].message
+
+        if i >= warmup and (i - warmup) % sample_every == 0:
+            gc.collect()
+            trim_heap()
+            rss = rss_mb()
+            samples.append((i, rss))
+            print(f'rerun {i:>6}  RSS {rss:8.1f} MB  figure pyplot terbuka {len(plt.get_fignums())}  error {errors}', flush=True)
+
+    return samples, errors, first_error
+
+
+def rss_trend(samples):
+    """(median RSS seperempat sampel pertama, median seperempat terakhir, kemiringan MB per 1000 rerun)."""
+    reruns, rss = np.array(samples, dtype='float64').T
+    window = max(1, len(rss) // 4)
+    slope = np.polyfit(reruns, rss, 1)[0] * 1000 if len(rss) > 1 else 0.0
+    return np.median(rss[:window]), np.median(rss[-window:]), slope
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=2000)
+    parser.add_argument('--combos', type=int, default=8, help='jumlah kombinasi filter acak yang diputar')
+    parser.add_argument('--render-every', type=int, default=50, help='kosongkan cache gambar setiap N rerun')
+    parser.add_argument('--warmup', type=int, default=300, help='rerun sebelum sampel RSS pertama diambil')
+    parser.add_argument('--sample-every', type=int, default=10)
+    parser.add_argument('--max-growth-mb', type=float, default=MAX_GROWTH_MB,
+                        help='batas kenaikan median RSS seperempat sampel terakhir vs pertama')
+    parser.add_argument('--figure-cache-mb', type=float, default=4, help='batas cache gambar selama soak')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    samples, errors, first_error = run(args.reruns, args.combos, args.render_every, min(args.warmup, args.reruns),
+                                       args.sample_every, args.seed, args.figure_cache_mb)
+    failures = []
+    if samples:
+        first, last, slope = rss_trend(samples)
+        growth = last - first
+        print(f'Median RSS seperempat sampel pertama {first:.1f} MB, terakhir {last:.1f} MB, naik {growth:+.1f} MB; '
+              f'tren {slope:+.2f} MB per 1000 rerun')
+        if growth > args.max_growth_mb:
+            failures.append(f'RSS naik {growth:.1f} MB (batas {args.max_growth_mb} MB)')
+    if errors:
+        failures.append(f'{errors} rerun berakhir dengan error, pertama: {first_error}')
+    if plt.get_fignums():
+        failures.append(f'{len(plt.get_fignums())} figure pyplot tidak ditutup')
+    if failures:
+        print('GAGAL: ' + '; '.join(failures))
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""Benchmark headless jalur data dashboard per tahap, pada hour.csv asli dan versi yang diperbesar.
+
+Setiap skala dijalankan di proses Python baru. Tahap-tahapnya sama dengan yang
+dijalankan dashboard (tanpa Streamlit dan tanpa cache node/gambar):
+
+- ``load``: parsing hour.csv
+- ``rollup`` / ``cube``: frame harian dan cube per jam dari data per jam
+- ``filter_days`` / ``filter_hours``: filter tanggal, musim dan cuaca (node ``bikeshare.pipeline``)
+- ``monthly``, ``scatter``, ``hourly``, ``rfm``: data tiap grafik
+- ``render``: semua grafik matplotlib dirender ke PNG
+
+Untuk setiap tahap dilaporkan waktu, puncak memori di atas RSS sebelum tahap
+itu (VmHWM diatur ulang sebelum setiap tahap), dan throughput dalam baris
+masukan per detik. Tahap komputasi diulang ``--repeat`` kali dan waktu
+terbaik yang dipakai.
+
+Versi yang diperbesar adalah hour.csv yang diulang N kali (lihat
+``benchmark.replicate_csv``), atau dengan ``--synthetic`` data sintetis N
+stasiun selama dua tahun (``bikeshare.synth``). Keduanya mencakup tanggal yang
+sama, seolah ada N kali lebih banyak stasiun. Karena itu tahap berbasis data
+harian (filter_days, monthly, scatter, rfm) tetap memproses jumlah hari yang
+sama; yang membesar adalah load, rollup dan cube.
+
+Hasil bisa disimpan sebagai JSON dan dibandingkan dengan hasil commit lain::
+
+    python -m bikeshare.stagebench --scales 1,10,100,1000 --json bench-baru.json
+    python -m bikeshare.stagebench --scales 1,10 --compare bench-lama.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bikeshare.procstat import peak_rss_mb, reset_peak_rss, rss_mb
+
+DEFAULT_SCALES = '1,10,100,1000'
+
+
+def _measure(results, name, rows, func, repeat=1):
+    """Menjalankan `func` `repeat` kali, mencatat waktu terbaik dan puncak memori; mengembalikan hasil terakhir."""
+    best, value = None, None
+    rss_before = rss_mb()
+    reset_peak_rss()
+    for _ in range(repeat):
+        value = None  # hasil putaran sebelumnya dilepas agar tidak ikut terhitung di puncak memori
+        start = time.perf_counter()
+        value = func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    rows = rows(value) if callable(rows) else rows
+    results.append({
+        'stage': name,
+        'rows': rows,
+        'seconds': best,
+        'rows_per_second': rows / best if best else None,
+        'peak_mb': peak_rss_mb() - rss_before,
+    })
+    return value
+
+
+def _stage_filters(day_data):
+    """Filter yang mewakili pemakaian biasa: satu tahun di tengah data, tiga musim, dua cuaca."""
+    from bikeshare import schema
+    from bikeshare.pipeline import sources
+
+    start = day_data.min_date + (day_data.max_date - day_data.min_date) / 4
+    return sources(None, None, start, start + (day_data.max_date - day_data.min_date) / 2,
+                   schema.SEASON_LABELS[:3], schema.WEATHER_LABELS[:2])
+
+
+def _aggregate_stages(results, csv_path, repeat):
+    """Tahap load, rollup dan cube; frame per jam hanya hidup di dalam fungsi ini."""
+    from bikeshare import aggregates
+    from bikeshare.loader import read_hour_csv
+    from bikeshare.query import IndexedFrame
+
+    hour_data = _measure(results, 'load', len, lambda: read_hour_csv(csv_path))
+    day_data = _measure(results, 'rollup', len(hour_data),
+                        lambda: IndexedFrame(aggregates.rollup_days(hour_data).set_index('dteday')), repeat)
+    hourly_cube = _measure(results, 'cube', len(hour_data),
+                           lambda: IndexedFrame(aggregates.build_hourly_cube(hour_data)), repeat)
+    return day_data, hourly_cube
+
+
+def run_stages(csv_path, repeat):
+    """Dijalankan di subproses: semua tahap pada satu CSV; mengembalikan daftar hasil per tahap."""
+    from bikeshare import charts, pipeline
+    from bikeshare.figures import figure_to_png, release_figure
+
+    results = []
+    # Frame per jam dilepas saat fungsi ini kembali, sebelum tahap berikutnya diukur
+    day_data, hourly_cube = _aggregate_stages(results, csv_path, repeat)
+
+    f = _stage_filters(day_data)
+    days = _measure(results, 'filter_days', len(day_data), lambda: pipeline.days(
+        day_data, f['start_date'], f['end_date'], f['seasons'], f['weather_conditions'],
+    ), repeat)
+    hours = _measure(results, 'filter_hours', len(hourly_cube), lambda: pipeline.hours(
+        hourly_cube, f['start_date'], f['end_date'], f['seasons'], f['weather_conditions'],
+    ), repeat)
+
+    monthly = _measure(results, 'monthly', len(days), lambda: pipeline.monthly(days), repeat)
+    scatter = _measure(results, 'scatter', len(days), lambda: pipeline.scatter(days), repeat)
+    hourly = _measure(results, 'hourly', len(hours),
+                      lambda: (pipeline.hourly_holiday(hours), pipeline.hourly_weather(hours)), repeat)
+    rfm_data = _measure(results, 'rfm', len(days),
+                        lambda: pipeline.rfm(days, pipeline.rfm_edges(day_data)), repeat)
+
+    scatter_chart, scatter_data, _ = scatter
+    figures = [
+        ('monthly_chart', (monthly,)),
+        (scatter_chart, (scatter_data,)),
+        ('hourly_holiday_chart', hourly[0]),
+        ('hourly_weather_chart', (hourly[1],)),
+        ('rfm_histograms', (rfm_data[['Recency', 'Frequency', 'Monetary']],)),
+    ]
+
+    def render_all():
+        for name, frames in figures:
+            fig = getattr(charts, name)(*frames)
+            try:
+                figure_to_png(fig)
+            finally:
+                release_figure(fig)
+
+    _measure(results, 'render', sum(len(frame) for _, frames in figures for frame in frames), render_all, repeat)
+    return results
+
+
+def measure_scale(csv_path, repeat):
+    output = subprocess.run(
+        [sys.executable, '-m', 'bikeshare.stagebench', '--run-once', csv_path, '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def scaled_csv(csv_path, scale, out_path, synthetic=False):
+    """CSV `scale` kali lebih besar dari `csv_path`: salinan berulang atau data sintetis `scale` stasiun."""
+    if synthetic:
+        from bikeshare import schema, synth
+
+        model = synth.fit(schema.read_csv(csv_path, schema.HOUR_DTYPES))
+        synth.write_csv(synth.generate(model, years=2, stations=scale, seed=scale), out_path)
+        return out_path
+    if scale == 1:
+        return csv_path
+    from bikeshare.benchmark import replicate_csv
+
+    return replicate_csv(csv_path, scale, out_path)
+
+
+def run(csv_path, scales, repeat, synthetic=False):
+    report = {'commit': _git_commit(), 'repeat': repeat, 'synthetic': synthetic, 'scales': {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            path = scaled_csv(csv_path, scale, os.path.join(tmp, f'hour-x{scale}.csv'), synthetic)
+            report['scales'][str(scale)] = measure_scale(path, repeat)
+            if path != csv_path:
+                os.remove(path)
+    return report
+
+
+def print_report(report, baseline=None):
+    compare = baseline is not None
+    header = f"{'skala':>6} {'tahap':<13} {'baris':>10} {'detik':>9} {'baris/detik':>13} {'puncak MB':>10}"
+    print(header + (f" {'vs dasar':>9}" if compare else ''))
+    for scale, stages in report['scales'].items():
+        base = {s['stage']: s for s in (baseline or {}).get('scales', {}).get(scale, [])}
+        for s in stages:
+            line = (f"{'x' + scale:>6} {s['stage']:<13} {s['rows']:>10} {s['seconds']:>9.4f} "
+                    f"{s['rows_per_second'] or 0:>13,.0f} {s['peak_mb']:>10.1f}")
+            if compare:
+                old = base.get(s['stage'])
+                line += f" {s['seconds'] / old['seconds']:>8.2f}x" if old and old['seconds'] else f" {'-':>9}"
+            print(line)
+
+
+def main():
+    from bikeshare.loader import HOUR_CSV
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--csv', default=HOUR_CSV)
+    parser.add_argument('--scales', default=DEFAULT_SCALES, help=f'faktor replikasi hour.csv (default {DEFAULT_SCALES})')
+    parser.add_argument('--repeat', type=int, default=3, help='jumlah pengulangan tahap komputasi (waktu terbaik dipakai)')
+    parser.add_argument('--synthetic', action='store_true', help='pakai data sintetis (bikeshare.synth) alih-alih salinan hour.csv')
+    parser.add_argument('--json', help='simpan hasil ke file JSON')
+    parser.add_argument('--compare', help='file JSON hasil sebelumnya; waktu ditampilkan relatif terhadapnya')
+    parser.add_argument('--run-once', metavar='CSV', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_once:
+        print(json.dumps(run_stages(args.run_once, args.repeat)))
+        return
+
+    report = run(args.csv, [int(scale) for scale in args.scales.split(',')], args.repeat, args.synthetic)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""Backend penyimpanan SQLite: data bike-share dalam satu file database lokal.
+
+Database berisi tabel ``hours`` (baris hour.csv) dan ``days`` (rollup harian),
+dengan index pada ``dteday``, ``season``, ``weathersit`` dan ``hr``. Filter
+tanggal/musim/cuaca dan pengelompokan grafik per jam dijalankan sebagai query,
+jadi yang sampai ke Python hanya baris hasil agregasi. Banyak proses dashboard
+bisa membaca satu file yang sama tanpa masing-masing menyimpan salinan data.
+
+``DayTable`` dan ``HourCube`` punya antarmuka yang sama dengan ``IndexedFrame``
+(``select``, ``token``, ...) sehingga pipeline filter tidak perlu diubah. Kode
+musim/cuaca disimpan sebagai angka dan diubah ke label setelah query.
+
+Membangun database secara manual::
+
+    python -m bikeshare.store
+"""
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from bikeshare import aggregates, schema
+from bikeshare.query import new_token
+
+# Naikkan jika isi atau skema database berubah agar database lama dibangun ulang
+STORE_VERSION = '1'
+
+INDEXES = """
+CREATE INDEX hours_dteday ON hours (dteday);
+CREATE INDEX hours_season ON hours (season);
+CREATE INDEX hours_weathersit ON hours (weathersit);
+CREATE INDEX hours_hr ON hours (hr);
+CREATE INDEX days_dteday ON days (dteday);
+"""
+
+# Dimensi cube per jam tanpa tanggal: hasil query sudah dijumlahkan untuk rentang tanggal yang dipilih
+HOUR_GROUPS = ['hr', 'holiday', 'weathersit', 'season']
+
+
+def store_path(csv_path):
+    """Lokasi database untuk sebuah CSV: data/<nama>.sqlite."""
+    return os.path.splitext(csv_path)[0] + '.sqlite'
+
+
+def _iso_dates(values):
+    return np.datetime_as_string(np.asarray(values, dtype='datetime64[ns]'), unit='D')
+
+
+def _to_codes(frame):
+    """Frame siap tulis: label kembali menjadi kode 1..n dan tanggal menjadi teks ISO."""
+    columns = {col: frame[col].cat.codes.astype('int16') + 1 for col in schema.LABEL_COLUMNS if col in frame.columns}
+    if 'dteday' in frame.columns:
+        columns['dteday'] = _iso_dates(frame['dteday'])
+    return frame.assign(**columns)
+
+
+def _from_codes(frame, dtypes):
+    """Kebalikan ``_to_codes`` untuk hasil query: dtype skema, label kategorikal, tanggal datetime64."""
+    frame = frame.astype({col: dtype for col, dtype in dtypes.items() if col in frame.columns})
+    if 'dteday' in frame.columns:
+        frame['dteday'] = pd.to_datetime(frame['dteday'], format='%Y-%m-%d')
+    return schema.apply_labels(frame)
+
+
+def is_fresh(db_path, fingerprint):
+    """True jika database ada dan dibangun dari isi CSV yang sama."""
+    if not os.path.exists(db_path):
+        return False
+    try:
+        with sqlite3.connect(f'file:{db_path}?mode=ro', uri=True) as con:
+            meta = dict(con.execute('SELECT key, value FROM meta'))
+    except sqlite3.Error:
+        return False
+    return meta.get('source_fingerprint') == fingerprint and meta.get('store_version') == STORE_VERSION
+
+
+def build(db_path, chunks, fingerprint):
+    """Membangun database dari potongan hour_data (`chunks`) secara atomik.
+
+    Baris per jam ditulis per potongan, rollup harian digabung dari agregat
+    parsial tiap potongan, jadi memori tidak bergantung pada ukuran data.
+    """
+    tmp_path = f'{db_path}.{os.getpid()}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    con = sqlite3.connect(tmp_path)
+    try:
+        days = None
+        for chunk in chunks:
+            _to_codes(chunk).to_sql('hours', con, if_exists='append', index=False)
+            chunk_days = aggregates.partial_rollup(chunk, 'D')
+            days = chunk_days if days is None else aggregates.merge_rollups([days, chunk_days])
+        days = aggregates.days_from_rollup(aggregates.finish_rollup(days))
+        _to_codes(days.drop(columns='month')).to_sql('days', con, index=False)
+        con.executescript(INDEXES)
+        con.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)')
+        con.executemany('INSERT INTO meta VALUES (?, ?)', [('source_fingerprint', fingerprint), ('store_version', STORE_VERSION)])
+        con.commit()
+    finally:
+        con.close()
+    os.replace(tmp_path, db_path)
+    return db_path
+
+
+class SqliteStore:
+    """Koneksi baca-saja ke database; satu koneksi per thread (sesi Streamlit berjalan di thread berbeda)."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self.days = DayTable(self)
+        self.hours = HourCube(self)
+
+    def connection(self):
+        con = getattr(self._local, 'con', None)
+        if con is None:
+            con = self._local.con = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True)
+        return con
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.connection(), params=params)
+
+
+def _where(start, end, selections):
+    """Klausa WHERE dan parameternya untuk rentang tanggal dan label terpilih."""
+    clauses, params = ['dteday BETWEEN ? AND ?'], [str(pd.Timestamp(start).date()), str(pd.Timestamp(end).date())]
+    for col, labels in selections.items():
+        categories = list(schema.LABEL_COLUMNS[col].categories)
+        codes = [categories.index(label) + 1 for label in labels if label in categories]
+        if len(codes) == len(categories):
+            continue
+        clauses.append(f'{col} IN ({", ".join("?" * len(codes))})')
+        params.extend(codes)
+    return ' AND '.join(clauses), params
+
+
+class DayTable:
+    """Frame harian di database, dengan antarmuka seperti ``IndexedFrame``."""
+
+    def __init__(self, store):
+        self.store = store
+        self.token = new_token()
+        bounds = store.query('SELECT MIN(dteday) AS lo, MAX(dteday) AS hi, COUNT(*) AS n FROM days')
+        self.min_date, self.max_date = pd.Timestamp(bounds['lo'][0]), pd.Timestamp(bounds['hi'][0])
+        self._len = int(bounds['n'][0])
+
+    def __len__(self):
+        return self._len
+
+    def filter_range(self, start, end):
+        return self.select(start, end)
+
+    def select(self, start, end, **selections):
+        where, params = _where(start, end, selections)
+        days = self.store.query(f'SELECT * FROM days WHERE {where} ORDER BY dteday', params)
+        days = _from_codes(days, schema.DAY_DTYPES)
+        days['month'] = days['dteday'].dt.month.astype('int8')
+        return days.set_index('dteday')
+
+
+class HourCube:
+    """Cube per jam di database: ``select`` mengembalikan jumlah per jam x hari libur x cuaca x musim."""
+
+    def __init__(self, store):
+        self.store = store
+        self.token = new_token()
+
+    def select(self, start, end, **selections):
+        where, params = _where(start, end, selections)
+        groups = ', '.join(HOUR_GROUPS)
+        sums = ', '.join(f'SUM({col}) AS {col}' for col in aggregates.CUBE_MEASURES)
+        cube = self.store.query(f'SELECT {groups}, {sums} FROM hours WHERE {where} GROUP BY {groups}', params)
+        return _from_codes(cube, {**schema.HOUR_DTYPES, **{col: 'int32' for col in aggregates.CUBE_MEASURES}})
+
+
+def main():
+    from bikeshare.loader import HOUR_CSV, file_fingerprint, read_hour_chunks
+
+    db_path = store_path(HOUR_CSV)
+    build(db_path, read_hour_chunks(HOUR_CSV), file_fingerprint(HOUR_CSV))
+    print(f'{HOUR_CSV} -> {db_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""Generator data per jam sintetis dengan skema hour.csv, untuk uji skala.
+
+Model sederhana di-fit dari hour.csv (``fit``):
+
+- profil ``cnt`` per jam untuk hari kerja dan bukan hari kerja, beserta
+  porsi ``casual`` per jam;
+- efek cuaca, suhu (per desil suhu) dan tingkat per tahun terhadap ``cnt``,
+  plus sebaran noise log-normal sisanya;
+- rantai Markov perpindahan ``weathersit`` dari jam ke jam, per musim;
+- suhu harian per bulan dengan anomali AR(1) antarhari dan kurva suhu harian
+  per jam; ``hum`` berkorelasi dengan anomali suhu dan cuaca; ``atemp``
+  linear terhadap ``temp``; ``windspeed`` per cuaca.
+
+Hari libur mengikuti kalender libur federal AS ditambah Emancipation Day
+(libur DC, seperti di dataset), dan ``workingday``/``weekday`` dihitung dari
+kalender. Cuaca dan suhu sama untuk semua stasiun pada jam yang sama,
+sedangkan jumlah peminjaman berbeda per stasiun (skala per stasiun
+log-normal). Baris semua stasiun untuk jam yang sama ditulis berurutan.
+Skemanya tidak punya kolom stasiun, jadi total harian dashboard adalah total
+semua stasiun.
+
+Data ditulis per blok hari, jadi memori tidak bergantung pada ukuran output::
+
+    python -m bikeshare.synth --years 10 --stations 100 --out data/hour-synth.csv
+    BIKESHARE_HOUR_CSV=data/hour-synth.csv streamlit run dashboard.py
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import Holiday, USFederalHolidayCalendar, nearest_workday
+
+from bikeshare import schema
+
+COLUMNS = ['instant', 'dteday', 'season', 'yr', 'mnth', 'hr', 'holiday', 'weekday', 'workingday',
+           'weathersit', 'temp', 'atemp', 'hum', 'windspeed', 'casual', 'registered', 'cnt']
+
+WEATHER_CODES = 4
+TEMP_BINS = 10
+
+# yr disimpan sebagai int8 dan cnt per stasiun sebagai int16 (lihat schema.HOUR_DTYPES)
+MAX_YEARS = 127
+MAX_COUNT = np.iinfo('int16').max
+
+
+class HolidayCalendar(USFederalHolidayCalendar):
+    """Libur federal AS + Emancipation Day (16 April, digeser ke hari kerja terdekat)."""
+    rules = USFederalHolidayCalendar.rules + [Holiday('Emancipation Day', month=4, day=16, observance=nearest_workday)]
+
+
+def _group_mean(values, groups, size, fill=np.nan):
+    counts = np.bincount(groups, minlength=size)
+    sums = np.bincount(groups, weights=values, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), fill)
+
+
+def _fill_missing(values, default=1.0):
+    """Mengisi nilai NaN dengan nilai tetangga terdekat yang ada (atau `default`)."""
+    values = pd.Series(values).ffill().bfill()
+    return values.fillna(default).to_numpy()
+
+
+def fit(hour_data):
+    """Parameter model dari frame hour.csv dengan kode numerik (belum berlabel)."""
+    h = hour_data
+    hr = h['hr'].to_numpy('int64')
+    working = h['workingday'].to_numpy('int64')
+    weather = h['weathersit'].to_numpy('int64') - 1
+    season = h['season'].to_numpy('int64') - 1
+    month = h['mnth'].to_numpy('int64') - 1
+    yr = h['yr'].to_numpy('int64')
+    temp = h['temp'].to_numpy('float64')
+    hum = h['hum'].to_numpy('float64')
+    cnt = h['cnt'].to_numpy('float64')
+
+    # Profil harian: rata-rata cnt dan porsi casual per (hari kerja, jam)
+    slot = working * 24 + hr
+    profile = _group_mean(cnt, slot, 48).reshape(2, 24)
+    casual_share = (np.bincount(slot, weights=h['casual'].to_numpy('float64'), minlength=48)
+                    / np.maximum(np.bincount(slot, weights=cnt, minlength=48), 1)).reshape(2, 24)
+
+    # Efek pengali berurutan: cuaca, lalu desil suhu, lalu tahun, dari rasio terhadap profil
+    ratio = cnt / np.maximum(profile[working, hr], 1e-9)
+    weather_effect = _fill_missing(_group_mean(ratio, weather, WEATHER_CODES))
+    ratio = ratio / weather_effect[weather]
+    temp_bin = np.clip((temp * TEMP_BINS).astype('int64'), 0, TEMP_BINS - 1)
+    temp_effect = _fill_missing(_group_mean(ratio, temp_bin, TEMP_BINS))
+    ratio = ratio / temp_effect[temp_bin]
+    year_level = _group_mean(ratio, yr, yr.max() + 1, fill=1.0)
+    ratio = ratio / year_level[yr]
+    noise_sigma = float(np.std(np.log(ratio[cnt > 0])))
+
+    # Suhu: rata-rata harian per bulan, anomali AR(1) antarhari, kurva per jam
+    day = pd.factorize(h['dteday'])[0]
+    daily_temp = _group_mean(temp, day, day.max() + 1)
+    daily_month = _group_mean(month.astype('float64'), day, day.max() + 1).astype('int64')
+    month_temp = _group_mean(daily_temp, daily_month, 12)
+    anomaly = daily_temp - month_temp[daily_month]
+    anomaly_phi = float(np.corrcoef(anomaly[:-1], anomaly[1:])[0, 1])
+    diurnal = _group_mean(temp - daily_temp[day], hr, 24)
+    temp_noise = float(np.std(temp - daily_temp[day] - diurnal[hr]))
+    atemp_slope, atemp_intercept = np.polyfit(temp, h['atemp'].to_numpy('float64'), 1)
+    atemp_noise = float(np.std(h['atemp'].to_numpy('float64') - (atemp_slope * temp + atemp_intercept)))
+
+    # Kelembaban: rata-rata per bulan + kurva per jam + offset per cuaca + korelasi dengan anomali suhu harian
+    month_hum = _group_mean(hum, month, 12)
+    hum_diurnal = _group_mean(hum - month_hum[month], hr, 24)
+    hum_anomaly = hum - month_hum[month] - hum_diurnal[hr]
+    hum_weather = _fill_missing(_group_mean(hum_anomaly, weather, WEATHER_CODES), default=0.0)
+    temp_anomaly = temp - month_temp[month] - diurnal[hr]
+    hum_beta = float(np.polyfit(temp_anomaly, hum_anomaly - hum_weather[weather], 1)[0])
+    hum_noise = float(np.std(hum_anomaly - hum_weather[weather] - hum_beta * temp_anomaly))
+
+    wind = h['windspeed'].to_numpy('float64')
+    wind_mean = _fill_missing(_group_mean(wind, weather, WEATHER_CODES), default=0.0)
+    wind_std = _fill_missing(np.sqrt(_group_mean((wind - wind_mean[weather]) ** 2, weather, WEATHER_CODES)), default=0.0)
+
+    # Perpindahan cuaca jam ke jam per musim (sedikit smoothing agar tidak ada baris kosong)
+    transitions = np.full((4, WEATHER_CODES, WEATHER_CODES), 1e-3)
+    np.add.at(transitions, (season[1:], weather[:-1], weather[1:]), 1)
+    transitions /= transitions.sum(axis=2, keepdims=True)
+
+    # Musim per (bulan, tanggal) dari kalender dataset
+    dates = pd.DatetimeIndex(h['dteday'])
+    season_by_day = dict(zip(zip(dates.month, dates.day), season + 1))
+
+    return {
+        'profile': profile, 'casual_share': casual_share,
+        'weather_effect': weather_effect, 'temp_effect': temp_effect,
+        'year_level': year_level, 'noise_sigma': noise_sigma,
+        'month_temp': month_temp, 'anomaly_std': float(np.std(anomaly)), 'anomaly_phi': anomaly_phi,
+        'diurnal': diurnal, 'temp_noise': temp_noise,
+        'atemp': (float(atemp_slope), float(atemp_intercept), atemp_noise),
+        'month_hum': month_hum, 'hum_diurnal': hum_diurnal, 'hum_weather': hum_weather,
+        'hum_beta': hum_beta, 'hum_noise': hum_noise,
+        'wind_mean': wind_mean, 'wind_std': wind_std,
+        'transitions': transitions, 'season_by_day': season_by_day,
+    }
+
+
+def _weather_chain(rng, transitions, seasons, state):
+    """Kode cuaca (0..3) per jam dari rantai Markov; `seasons` = indeks musim per jam."""
+    cumulative = np.cumsum(transitions, axis=2)
+    draws = rng.random(len(seasons))
+    out = np.empty(len(seasons), dtype='int64')
+    for i, (s, u) in enumerate(zip(seasons, draws)):
+        state = min(int(np.searchsorted(cumulative[s, state], u)), WEATHER_CODES - 1)
+        out[i] = state
+    return out, state
+
+
+def generate(model, start='2011-01-01', years=2, stations=1, seed=0, block_days=31):
+    """Frame per blok `block_days` hari dengan skema hour.csv (kode numerik)."""
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f'years harus 1..{MAX_YEARS}')
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(start)
+    dates = pd.date_range(start, start + pd.DateOffset(years=years) - pd.Timedelta(days=1), freq='D')
+    holidays = HolidayCalendar().holidays(dates[0], dates[-1])
+    station_scale = rng.lognormal(0.0, 0.5, stations)
+    station_scale /= station_scale.mean()
+
+    m = model
+    anomaly_noise = m['anomaly_std'] * np.sqrt(max(1 - m['anomaly_phi'] ** 2, 0.0))
+    anomaly, weather_state, instant = 0.0, 0, 1
+    for first in range(0, len(dates), block_days):
+        days = dates[first:first + block_days]
+        n = len(days)
+
+        # Kalender per hari
+        month = days.month.to_numpy() - 1
+        weekday = (days.dayofweek.to_numpy() + 1) % 7  # 0 = Minggu seperti di dataset
+        holiday = days.isin(holidays)
+        working = ((weekday >= 1) & (weekday <= 5) & ~holiday).astype('int64')
+        season = np.array([m['season_by_day'].get((d.month, d.day), 1) for d in days]) - 1
+        yr = days.year.to_numpy() - start.year
+
+        # Anomali suhu harian AR(1), berlanjut antarblok
+        anomalies = np.empty(n)
+        for i, noise in enumerate(rng.normal(0.0, anomaly_noise, n)):
+            anomaly = m['anomaly_phi'] * anomaly + noise
+            anomalies[i] = anomaly
+
+        # Nilai per jam (sama untuk semua stasiun)
+        d = np.repeat(np.arange(n), 24)
+        hr = np.tile(np.arange(24), n)
+        weather, weather_state = _weather_chain(rng, m['transitions'], season[d], weather_state)
+        temp = np.clip(m['month_temp'][month[d]] + anomalies[d] + m['diurnal'][hr]
+                       + rng.normal(0.0, m['temp_noise'], n * 24), 0.02, 1.0)
+        slope, intercept, atemp_noise = m['atemp']
+        atemp = np.clip(slope * temp + intercept + rng.normal(0.0, atemp_noise, n * 24), 0.0, 1.0)
+        hum = np.clip(m['month_hum'][month[d]] + m['hum_diurnal'][hr] + m['hum_weather'][weather]
+                      + m['hum_beta'] * (temp - m['month_temp'][month[d]] - m['diurnal'][hr])
+                      + rng.normal(0.0, m['hum_noise'], n * 24), 0.0, 1.0)
+        wind = np.clip(rng.normal(m['wind_mean'][weather], m['wind_std'][weather]), 0.0, 1.0)
+
+        temp_bin = np.clip((temp * TEMP_BINS).astype('int64'), 0, TEMP_BINS - 1)
+        level = m['year_level'][np.clip(yr[d], 0, len(m['year_level']) - 1)]
+        expected = (m['profile'][working[d], hr] * m['weather_effect'][weather]
+                    * m['temp_effect'][temp_bin] * level)
+
+        # Jumlah peminjaman per (jam, stasiun): baris stasiun untuk jam yang sama berurutan
+        # Noise log-normal dengan rata-rata 1 agar rata-rata cnt tidak bergeser
+        sigma = m['noise_sigma']
+        lam = expected[:, None] * station_scale[None, :] * rng.lognormal(-sigma ** 2 / 2, sigma, (n * 24, stations))
+        cnt = np.minimum(rng.poisson(lam), MAX_COUNT).ravel()
+        casual = rng.binomial(cnt, np.repeat(m['casual_share'][working[d], hr], stations))
+
+        def per_row(values):
+            return np.repeat(values, stations)
+
+        rows = n * 24 * stations
+        yield pd.DataFrame({
+            'instant': np.arange(instant, instant + rows),
+            'dteday': per_row(days.strftime('%Y-%m-%d').to_numpy()[d]),
+            'season': per_row(season[d] + 1),
+            'yr': per_row(yr[d]),
+            'mnth': per_row(month[d] + 1),
+            'hr': per_row(hr),
+            'holiday': per_row(holiday[d].astype('int64')),
+            'weekday': per_row(weekday[d]),
+            'workingday': per_row(working[d]),
+            'weathersit': per_row(weather + 1),
+            'temp': per_row(temp.round(2)),
+            'atemp': per_row(atemp.round(4)),
+            'hum': per_row(hum.round(2)),
+            'windspeed': per_row(wind.round(4)),
+            'casual': casual,
+            'registered': cnt - casual,
+            'cnt': cnt,
+        }, columns=COLUMNS)
+        instant += rows
+
+
+def write_csv(frames, out):
+    """Menulis potongan frame ke `out` (path atau file) sebagai satu CSV; mengembalikan jumlah baris."""
+    close = isinstance(out, str)
+    f = open(out, 'w', newline='') if close else out
+    rows = 0
+    try:
+        for frame in frames:
+            frame.to_csv(f, index=False, header=(rows == 0))
+            rows += len(frame)
+    finally:
+        if close:
+            f.close()
+    return rows
+
+
+def main():
+    from bikeshare.loader import DATA_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', required=True, help="file CSV tujuan ('-' untuk stdout)")
+    parser.add_argument('--years', type=int, default=2, help=f'jumlah tahun (1..{MAX_YEARS}, default 2)')
+    parser.add_argument('--stations', type=int, default=1, help='jumlah stasiun (default 1)')
+    parser.add_argument('--start', default='2011-01-01', help='tanggal awal (default 2011-01-01, yr dihitung dari tahun ini)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--source', default=os.path.join(DATA_DIR, 'hour.csv'), help='hour.csv tempat model di-fit')
+    args = parser.parse_args()
+
+    model = fit(schema.read_csv(args.source, schema.HOUR_DTYPES))
+    frames = generate(model, args.start, args.years, args.stations, args.seed)
+    rows = write_csv(frames, sys.stdout if args.out == '-' else args.out)
+    print(f'{rows} baris ditulis ke {args.out}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Tabel berhalaman untuk menampilkan frame besar di dashboard.
+
+Hanya baris pada halaman yang terlihat (dan kolom yang dipilih) yang
+dikirim ke browser; pengurutan dan pemilihan kolom dikerjakan di server
+lewat ``bikeshare.query.table_page``. Tabel dibungkus ``st.fragment`` sehingga
+berpindah halaman hanya menjalankan ulang tabel ini, bukan seluruh dashboard.
+"""
+import math
+
+import streamlit as st
+
+from bikeshare.query import table_page
+
+PAGE_SIZES = [25, 50, 100, 500]
+
+ORIGINAL_ORDER = '(urutan asli)'
+
+
+@st.fragment
+def paginated_table(frame, key):
+    if frame.empty:
+        st.dataframe(frame, use_container_width=True)
+        return
+
+    columns = st.multiselect('Kolom yang ditampilkan', list(frame.columns), default=list(frame.columns), key=f'{key}_columns')
+    sort_options = [ORIGINAL_ORDER] + ([frame.index.name] if frame.index.name else []) + list(frame.columns)
+    col_sort, col_order, col_size = st.columns(3)
+    sort_by = col_sort.selectbox('Urutkan berdasarkan', sort_options, key=f'{key}_sort')
+    ascending = col_order.radio('Urutan', ['Naik', 'Turun'], horizontal=True, key=f'{key}_order') == 'Naik'
+    page_size = col_size.selectbox('Baris per halaman', PAGE_SIZES, key=f'{key}_page_size')
+
+    n_pages = max(1, math.ceil(len(frame) / page_size))
+    # Jumlah halaman ikut di key agar nomor halaman kembali ke 1 jika tidak lagi valid
+    page = st.number_input(f'Halaman (dari {n_pages})', min_value=1, max_value=n_pages, value=1, key=f'{key}_page_{n_pages}')
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(frame))
+    rows = table_page(frame, columns, None if sort_by == ORIGINAL_ORDER else sort_by, ascending, start, stop)
+    st.dataframe(rows, use_container_width=True)
+    st.caption(f'Baris {start + 1}–{stop} dari {len(frame)}')
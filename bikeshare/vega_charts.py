@@ -0,0 +1,118 @@
+"""Versi Vega-Lite dari grafik dashboard (dirender di browser).
+
+Setiap fungsi mengembalikan ``(data, spec)``: data yang sudah diagregasi dan
+dipangkas ke kolom yang dibutuhkan saja, serta spesifikasi Vega-Lite. Server
+tidak merender gambar apa pun; zoom dan hover terjadi di browser tanpa rerun.
+Nama fungsi mengikuti ``bikeshare.charts``.
+"""
+import numpy as np
+import pandas as pd
+
+RFM_COLORS = {'Recency': 'skyblue', 'Frequency': 'orange', 'Monetary': 'green'}
+
+
+def monthly_chart(monthly_data):
+    spec = {
+        'title': 'Jumlah Peminjaman Sepeda per Bulan Berdasarkan Musim dan Cuaca',
+        'mark': {'type': 'line', 'point': True},
+        'encoding': {
+            'x': {'field': 'Month', 'type': 'ordinal', 'title': 'Bulan'},
+            'y': {'field': 'Total Peminjaman', 'type': 'quantitative', 'title': 'Jumlah Peminjaman Sepeda'},
+            'color': {'field': 'Season', 'type': 'nominal'},
+            'strokeDash': {'field': 'Weather', 'type': 'nominal'},
+            'shape': {'field': 'Weather', 'type': 'nominal'},
+            'tooltip': [{'field': col} for col in ['Month', 'Season', 'Weather', 'Total Peminjaman']],
+        },
+        'params': [{'name': 'zoom', 'select': 'interval', 'bind': 'scales'}],
+    }
+    return monthly_data, spec
+
+
+def temp_hum_scatter(data):
+    spec = {
+        'title': 'Pengaruh Suhu dan Kelembaban terhadap Jumlah Peminjaman',
+        'mark': {'type': 'point', 'filled': True},
+        'encoding': {
+            'x': {'field': 'temp', 'type': 'quantitative', 'title': 'Suhu (°C)'},
+            'y': {'field': 'hum', 'type': 'quantitative', 'title': 'Kelembaban (%)'},
+            'color': {'field': 'weathersit', 'type': 'nominal', 'scale': {'scheme': 'set1'}},
+            'shape': {'field': 'season', 'type': 'nominal'},
+            'size': {'field': 'cnt', 'type': 'quantitative'},
+            'tooltip': [{'field': col} for col in ['temp', 'hum', 'weathersit', 'season', 'cnt']],
+        },
+        'params': [{'name': 'zoom', 'select': 'interval', 'bind': 'scales'}],
+    }
+    return data, spec
+
+
+def temp_hum_density(binned):
+    spec = {
+        'title': 'Pengaruh Suhu dan Kelembaban terhadap Jumlah Peminjaman',
+        'mark': 'rect',
+        'encoding': {
+            'x': {'field': 'temp_lo', 'type': 'quantitative', 'title': 'Suhu (°C)'},
+            'x2': {'field': 'temp_hi'},
+            'y': {'field': 'hum_lo', 'type': 'quantitative', 'title': 'Kelembaban (%)'},
+            'y2': {'field': 'hum_hi'},
+            'color': {'field': 'cnt', 'type': 'quantitative', 'title': 'Rata-rata cnt', 'scale': {'scheme': 'viridis'}},
+            'tooltip': [{'field': col} for col in ['temp_lo', 'temp_hi', 'hum_lo', 'hum_hi', 'cnt', 'n']],
+        },
+    }
+    return binned, spec
+
+
+def hourly_holiday_chart(data_working_day, data_holiday):
+    data = pd.concat([
+        data_working_day[['hr', 'cnt']].assign(Hari='Hari Kerja'),
+        data_holiday[['hr', 'cnt']].assign(Hari='Hari Libur'),
+    ], ignore_index=True)
+    spec = {
+        'title': 'Jumlah Peminjaman per Jam Berdasarkan Hari Libur',
+        'mark': 'line',
+        'encoding': {
+            'x': {'field': 'hr', 'type': 'quantitative', 'title': 'Jam'},
+            # Menggunakan log scale untuk sumbu Y untuk perbedaan besar
+            'y': {'field': 'cnt', 'type': 'quantitative', 'scale': {'type': 'log'},
+                  'title': 'Jumlah Peminjaman Sepeda (Log Scale)'},
+            'color': {'field': 'Hari', 'type': 'nominal'},
+            'tooltip': [{'field': col} for col in ['Hari', 'hr', 'cnt']],
+        },
+    }
+    return data, spec
+
+
+def hourly_weather_chart(hourly_weather_data):
+    spec = {
+        'title': 'Jumlah Peminjaman Sepeda per Jam Berdasarkan Cuaca',
+        'mark': 'line',
+        'encoding': {
+            'x': {'field': 'hr', 'type': 'quantitative', 'title': 'Jam'},
+            'y': {'field': 'cnt', 'type': 'quantitative', 'title': 'Jumlah Peminjaman Sepeda'},
+            'color': {'field': 'weathersit', 'type': 'nominal', 'title': 'Kondisi Cuaca'},
+            'tooltip': [{'field': col} for col in ['weathersit', 'hr', 'cnt']],
+        },
+    }
+    return hourly_weather_data, spec
+
+
+def rfm_histograms(rfm_data, bins=30):
+    # Histogram dihitung di server: yang dikirim hanya 3 x `bins` baris, bukan semua baris
+    parts = []
+    for metric in RFM_COLORS:
+        counts, edges = np.histogram(rfm_data[metric], bins=bins)
+        parts.append(pd.DataFrame({'metric': metric, 'start': edges[:-1], 'end': edges[1:], 'count': counts}))
+    spec = {
+        'mark': 'bar',
+        'encoding': {
+            'x': {'field': 'start', 'type': 'quantitative', 'bin': {'binned': True}, 'title': None},
+            'x2': {'field': 'end'},
+            'y': {'field': 'count', 'type': 'quantitative', 'title': None},
+            'color': {'field': 'metric', 'type': 'nominal', 'legend': None,
+                      'scale': {'domain': list(RFM_COLORS), 'range': list(RFM_COLORS.values())}},
+            'column': {'field': 'metric', 'type': 'nominal', 'sort': list(RFM_COLORS),
+                       'header': {'labelExpr': "'Distribusi ' + datum.value", 'title': None}},
+            'tooltip': [{'field': col} for col in ['metric', 'start', 'end', 'count']],
+        },
+        'resolve': {'scale': {'x': 'independent', 'y': 'independent'}},
+    }
+    return pd.concat(parts, ignore_index=True), spec